@@ -0,0 +1,106 @@
+from collections import defaultdict
+from typing import Optional
+
+from pagination import IssuePager
+from shaping import compact
+
+# Fields a sprint snapshot needs besides the board's estimation field
+SNAPSHOT_FIELDS = ["summary", "status", "assignee", "issuetype", "priority", "timeestimate", "timeoriginalestimate", "timespent"]
+
+
+class AgileResultList(list):
+    """One page of an Agile API issue listing with its total, like jira.client.ResultList"""
+
+    def __init__(self, items, total: Optional[int]):
+        super().__init__(items)
+        self.total = total
+
+
+class SprintIssuePager(IssuePager):
+    """Pages through a sprint's issues with the Agile API, prefetching later pages like IssuePager"""
+
+    def __init__(self, client, sprint_id: int, fields: str, page_size: int = 100, prefetch: int = 4):
+        super().__init__(client, f"sprint = {sprint_id}", fields=fields, page_size=page_size, prefetch=prefetch)
+        self.sprint_id = sprint_id
+
+    def _fetch(self, start_at: int):
+        data = self.client._get_json(
+            f"sprint/{self.sprint_id}/issue",
+            params={"startAt": start_at, "maxResults": self.page_size, "fields": self.fields},
+            base=self.client.AGILE_BASE_URL,
+        )
+        return AgileResultList(data.get("issues", []), data.get("total"))
+
+
+def estimation_field(board_configuration: dict) -> Optional[dict]:
+    """{"id", "name"} of the field a board estimates with, or None for issue count boards"""
+    estimation = board_configuration.get("estimation") or {}
+    field = estimation.get("field") or {}
+    if estimation.get("type") != "field" or not field.get("fieldId"):
+        return None
+    return {"id": field["fieldId"], "name": field.get("displayName") or field["fieldId"]}
+
+
+def _hours(seconds) -> float:
+    return round((seconds or 0) / 3600, 2)
+
+
+def _number(value) -> float:
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def summarize_sprint(issues: list, estimate_field: Optional[str] = None) -> dict:
+    """Aggregate estimates and remaining time of sprint issues by status and by assignee.
+
+    Time tracking fields (seconds) are reported in hours, as is an estimate field that is itself a time field"""
+    time_estimate = estimate_field in ("timeoriginalestimate", "timeestimate")
+    empty = lambda: {"issues": 0, "estimate": 0.0, "remaining_h": 0.0}
+    by_status = defaultdict(empty)
+    by_assignee = defaultdict(empty)
+    totals = {"issues": 0, "estimate": 0.0, "completed_estimate": 0.0, "remaining_h": 0.0, "spent_h": 0.0, "unestimated": 0}
+    rows = []
+
+    for issue in issues:
+        raw = getattr(issue, "raw", issue)
+        fields = raw.get("fields") or {}
+        status = fields.get("status") or {}
+        assignee = fields.get("assignee") or {}
+        value = fields.get(estimate_field) if estimate_field else None
+        estimate = _hours(value) if time_estimate else _number(value)
+        remaining = _hours(fields.get("timeestimate"))
+        done = (status.get("statusCategory") or {}).get("key") == "done"
+
+        status_name = status.get("name") or "Unknown"
+        assignee_name = assignee.get("displayName") or assignee.get("name") or "Unassigned"
+        for bucket in (by_status[status_name], by_assignee[assignee_name], totals):
+            bucket["issues"] += 1
+            bucket["estimate"] += estimate
+            bucket["remaining_h"] += 0.0 if done else remaining
+        totals["spent_h"] += _hours(fields.get("timespent"))
+        if done:
+            totals["completed_estimate"] += estimate
+        if estimate_field and value is None:
+            totals["unestimated"] += 1
+
+        rows.append(compact({
+            "key": raw.get("key"),
+            "summary": fields.get("summary"),
+            "type": (fields.get("issuetype") or {}).get("name"),
+            "priority": (fields.get("priority") or {}).get("name"),
+            "status": status_name,
+            "done": done,
+            "assignee": assignee_name,
+            "estimate": value if value is None or not time_estimate else estimate,
+            "remaining_h": remaining,
+        }))
+
+    round_all = lambda groups: {name: {k: round(v, 2) for k, v in bucket.items()} for name, bucket in sorted(groups.items())}
+    return {
+        "totals": {k: round(v, 2) for k, v in totals.items()},
+        "by_status": round_all(by_status),
+        "by_assignee": round_all(by_assignee),
+        "issues": rows,
+    }
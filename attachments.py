@@ -0,0 +1,141 @@
+import base64
+import os
+import threading
+from typing import Callable, Optional
+
+from config import config
+
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+
+class ProgressThrottle:
+    """Forwards byte progress to a callback at most once per `step` bytes (and always at the end)"""
+
+    def __init__(self, callback: Optional[ProgressCallback], total: Optional[int], step: int):
+        self.callback = callback
+        self.total = total
+        self.step = max(1, step)
+        self.done = 0
+        self._reported = 0
+        self._lock = threading.Lock()
+
+    def advance(self, amount: int) -> None:
+        with self._lock:
+            self.done += amount
+            if self.callback is None:
+                return
+            if self.done - self._reported >= self.step or (self.total is not None and self.done >= self.total):
+                self._reported = self.done
+                # Multipart framing makes uploads send slightly more bytes than the file sizes
+                self.callback(self.done if self.total is None else min(self.done, self.total), self.total)
+
+
+def check_size(path: str) -> int:
+    """Size of a file to upload, enforcing JIRA_ATTACHMENT_MAX_BYTES"""
+    size = os.path.getsize(path)
+    if config.attachment_max_bytes and size > config.attachment_max_bytes:
+        raise ValueError(f"{path} is {size} bytes, above the {config.attachment_max_bytes} byte attachment limit")
+    return size
+
+
+def upload(client, issue_key: str, path: str, filename: Optional[str] = None, progress: Optional[ProgressThrottle] = None) -> dict:
+    """Stream a file to the issue as a multipart upload without reading it into memory"""
+    from requests_toolbelt import MultipartEncoder, MultipartEncoderMonitor
+
+    check_size(path)
+    with open(path, "rb") as f:
+        encoder = MultipartEncoder(fields={"file": (filename or os.path.basename(path), f, "application/octet-stream")})
+        seen = 0
+
+        def on_read(monitor) -> None:
+            nonlocal seen
+            if progress is not None:
+                progress.advance(monitor.bytes_read - seen)
+            seen = monitor.bytes_read
+
+        monitor = MultipartEncoderMonitor(encoder, on_read)
+        response = client._session.post(
+            client._get_url(f"issue/{issue_key}/attachments"),
+            data=monitor,
+            headers={"content-type": monitor.content_type, "X-Atlassian-Token": "no-check"},
+        )
+    attachment = response.json()[0]
+    return {"id": attachment["id"], "filename": attachment["filename"], "size": attachment["size"]}
+
+
+def download(client, attachment_id: str, output_path: Optional[str] = None, offset: int = 0, length: Optional[int] = None, progress: Optional[ProgressCallback] = None) -> dict:
+    """Stream an attachment to output_path, or return the byte range [offset, offset+length) inline.
+
+    Ranges are requested with a Range header; when the server ignores it the skipped bytes are
+    read and discarded, so memory stays bounded by the chunk size either way"""
+    meta = client.attachment(attachment_id)
+    size = int(getattr(meta, "size", 0) or 0)
+    if output_path is None:
+        length = min(length or config.attachment_inline_max_bytes, config.attachment_inline_max_bytes)
+    end = size if length is None else min(size, offset + length)
+    wanted = max(0, end - offset)
+
+    result = {"id": attachment_id, "filename": meta.filename, "mimeType": getattr(meta, "mimeType", None), "size": size, "offset": offset}
+    if wanted == 0:
+        # Nothing to transfer (an empty attachment or an offset past the end), so skip the request
+        if output_path is None:
+            return _inline(result, b"", size)
+        open(output_path, "wb").close()
+        result.update({"path": os.path.abspath(output_path), "bytes": 0})
+        return result
+
+    headers = {}
+    if offset or length is not None:
+        headers["Range"] = f"bytes={offset}-{end - 1}"
+    response = client._session.get(meta.content, stream=True, headers=headers)
+    skip = offset if response.status_code != 206 else 0
+    throttle = ProgressThrottle(progress, wanted, config.attachment_chunk_size)
+
+    def chunks():
+        nonlocal skip
+        remaining = wanted
+        for chunk in response.iter_content(config.attachment_chunk_size):
+            if skip:
+                dropped = min(skip, len(chunk))
+                chunk = chunk[dropped:]
+                skip -= dropped
+            if not chunk:
+                continue
+            chunk = chunk[:remaining]
+            remaining -= len(chunk)
+            throttle.advance(len(chunk))
+            yield chunk
+            if remaining <= 0:
+                break
+
+    try:
+        if output_path is None:
+            return _inline(result, b"".join(chunks()), size)
+        tmp_path = f"{output_path}.part"
+        written = 0
+        try:
+            with open(tmp_path, "wb") as f:
+                for chunk in chunks():
+                    f.write(chunk)
+                    written += len(chunk)
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            # Do not leave a partial download behind
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        result.update({"path": os.path.abspath(output_path), "bytes": written})
+        return result
+    finally:
+        response.close()
+
+
+def _inline(result: dict, data: bytes, size: int) -> dict:
+    """Complete a download result with the content inline, as text for text types and base64 otherwise"""
+    result["bytes"] = len(data)
+    if (result["mimeType"] or "").startswith("text/") or result["mimeType"] in ("application/json", "application/xml"):
+        result["text"] = data.decode("utf-8", errors="replace")
+    else:
+        result["base64"] = base64.b64encode(data).decode()
+    result["truncated"] = result["offset"] + len(data) < size
+    return result
@@ -0,0 +1,46 @@
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import Any, Callable, Iterable
+
+from runtime import submit
+
+
+def chunked(items: list, size: int) -> Iterable[list]:
+    """Split a list into consecutive chunks of at most size items"""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def run_batch(keys: Iterable[str], operation: Callable[[str], Any], max_workers: int = 8) -> dict:
+    """Run operation(key) for every key with at most max_workers in flight and report per-key outcome"""
+    keys = list(dict.fromkeys(keys))
+    outcomes = {}
+    queue = iter(keys)
+    in_flight = {}
+    for key in queue:
+        in_flight[submit(operation, key)] = key
+        if len(in_flight) >= max(1, max_workers):
+            break
+    while in_flight:
+        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+        for future in done:
+            outcomes[in_flight.pop(future)] = future
+            key = next(queue, None)
+            if key is not None:
+                in_flight[submit(operation, key)] = key
+
+    succeeded = []
+    failed = []
+    results = {}
+    for key in keys:
+        future = outcomes[key]
+        if future.exception() is not None:
+            failed.append({"key": key, "error": str(future.exception())})
+            continue
+        succeeded.append(key)
+        if future.result() is not None:
+            results[key] = future.result()
+
+    report = {"succeeded": succeeded, "failed": failed}
+    if results:
+        report["results"] = results
+    return report
@@ -0,0 +1,419 @@
+"""Fake Jira REST server for benchmarks: a synthetic project with configurable latency, page size, payload size and 429 injection.
+
+Serves the endpoints the tools in main.py use (platform REST API v2 and Agile 1.0) and counts upstream calls per route.
+It can also be run on its own to point a manually started server at it:
+
+    uv run python benchmarks/fakejira.py --port 8089 --latency 0.05 --issues 2000
+"""
+import argparse
+import json
+import re
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+PROJECT = "BENCH"
+STATUSES = [("Open", "new"), ("In Progress", "indeterminate"), ("Done", "done")]
+USERS = ["Alice", "Bob", "Carol", "Dave"]
+# The authenticated user is the first of USERS, so currentUser() matches some issues
+ME = {"name": "alice", "accountId": "acc-0", "displayName": USERS[0], "timeZone": "UTC"}
+STORY_POINTS = "customfield_10016"
+SPRINT_ID = 1
+BOARD_ID = 1
+
+# Clause names and schemas as Jira returns them; python-jira looks up search fields by clause name
+# and fetches the list again on every search while it finds none
+FIELDS = [
+    {"id": "summary", "name": "Summary", "custom": False, "clauseNames": ["summary"], "schema": {"type": "string", "system": "summary"}},
+    {"id": "description", "name": "Description", "custom": False, "clauseNames": ["description"], "schema": {"type": "string", "system": "description"}},
+    {"id": "status", "name": "Status", "custom": False, "clauseNames": ["status"], "schema": {"type": "status", "system": "status"}},
+    {"id": "assignee", "name": "Assignee", "custom": False, "clauseNames": ["assignee"], "schema": {"type": "user", "system": "assignee"}},
+    {"id": "issuetype", "name": "Issue Type", "custom": False, "clauseNames": ["issuetype", "type"], "schema": {"type": "issuetype", "system": "issuetype"}},
+    {"id": "priority", "name": "Priority", "custom": False, "clauseNames": ["priority"], "schema": {"type": "priority", "system": "priority"}},
+    {"id": "labels", "name": "Labels", "custom": False, "clauseNames": ["labels"], "schema": {"type": "array", "items": "string", "system": "labels"}},
+    {"id": "created", "name": "Created", "custom": False, "clauseNames": ["created", "createdDate"], "schema": {"type": "datetime", "system": "created"}},
+    {"id": "updated", "name": "Updated", "custom": False, "clauseNames": ["updated", "updatedDate"], "schema": {"type": "datetime", "system": "updated"}},
+    {"id": "timeestimate", "name": "Remaining Estimate", "custom": False, "clauseNames": ["remainingEstimate", "timeestimate"], "schema": {"type": "number", "system": "timeestimate"}},
+    {"id": "worklog", "name": "Log Work", "custom": False, "clauseNames": [], "schema": {"type": "array", "items": "worklog", "system": "worklog"}},
+    {"id": STORY_POINTS, "name": "Story Points", "custom": True, "clauseNames": ["cf[10016]", "Story Points"],
+     "schema": {"type": "number", "custom": "com.atlassian.jira.plugin.system.customfieldtypes:float", "customId": 10016}},
+]
+
+
+class FakeJira:
+    """In-process Jira stand-in.
+
+    latency is added to every request, page_size caps maxResults like a real server, payload_bytes pads each issue's
+    description, and every throttle_every-th request is answered with 429 and Retry-After: retry_after"""
+
+    def __init__(self, issues: int = 1000, latency: float = 0.02, page_size: int = 100, payload_bytes: int = 1024,
+                 throttle_every: int = 0, retry_after: float = 0.0, worklogs_per_issue: int = 4, port: int = 0):
+        self.issues = issues
+        self.latency = latency
+        self.page_size = page_size
+        self.payload_bytes = payload_bytes
+        self.throttle_every = throttle_every
+        self.retry_after = retry_after
+        self.worklogs_per_issue = worklogs_per_issue
+        self.calls = Counter()
+        self.requests = 0
+        # Fields written with PUT issue, by issue number
+        self.edits: dict[int, dict] = {}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), _Handler)
+        self._server.daemon_threads = True
+        self._server.fake = self
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def start(self) -> "FakeJira":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-jira", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def counts(self) -> dict:
+        """Upstream calls so far: total, throttled and per route"""
+        with self._lock:
+            return {"total": self.requests, "throttled": self.calls["429"], "routes": dict(self.calls)}
+
+    def reset_counts(self) -> None:
+        with self._lock:
+            self.calls.clear()
+            self.requests = 0
+
+    def record(self, route: str) -> bool:
+        """Count a request; True when it should be throttled"""
+        with self._lock:
+            self.requests += 1
+            self.calls[route] += 1
+            throttle = bool(self.throttle_every) and self.requests % self.throttle_every == 0
+            if throttle:
+                self.calls["429"] += 1
+            return throttle
+
+    # Synthetic data
+
+    def issue(self, number: int, fields: str = "*all") -> dict:
+        status, category = STATUSES[number % len(STATUSES)]
+        all_fields = {
+            "summary": f"Benchmark issue {number}",
+            "description": "x" * self.payload_bytes,
+            "status": {"name": status, "statusCategory": {"key": category}},
+            "assignee": {"displayName": USERS[number % len(USERS)], "accountId": f"acc-{number % len(USERS)}"} if number % 5 else None,
+            "issuetype": {"name": "Story" if number % 2 else "Bug"},
+            "priority": {"name": "Medium"},
+            "labels": (["bench"] if number % 3 == 0 else []) + (["urgent"] if number % 4 == 0 else []),
+            "created": "2024-05-01T09:00:00.000+0000",
+            "updated": f"2024-05-{1 + number % 28:02d}T09:00:00.000+0000",
+            "timeestimate": 3600 * (number % 8),
+            STORY_POINTS: number % 8 or None,
+        }
+        all_fields.update(self.edits.get(number, {}))
+        wanted = [f.strip() for f in (fields or "*all").split(",") if f.strip()]
+        everything = any(f in ("*all", "*navigable") for f in wanted)
+        if everything or "worklog" in wanted:
+            worklogs = self.worklogs(number)
+            all_fields["worklog"] = {"startAt": 0, "maxResults": 20, "total": len(worklogs), "worklogs": worklogs[:20]}
+        if not everything:
+            all_fields = {name: value for name, value in all_fields.items() if name in wanted}
+        return {"id": str(10000 + number), "key": f"{PROJECT}-{number}", "self": f"{self.url}/rest/api/2/issue/{10000 + number}", "fields": all_fields}
+
+    def worklogs(self, number: int) -> list:
+        return [{
+            "id": str(number * 100 + index),
+            "issueId": str(10000 + number),
+            "author": {"displayName": USERS[(number + index) % len(USERS)]},
+            "started": f"2024-05-{1 + (number + index) % 28:02d}T10:00:00.000+0000",
+            "timeSpentSeconds": 1800 * (1 + index % 4),
+        } for index in range(self.worklogs_per_issue)]
+
+    def number_of(self, key_or_id: str) -> int:
+        if key_or_id.isdigit():
+            return int(key_or_id) - 10000
+        return int(key_or_id.rsplit("-", 1)[1])
+
+    def page(self, numbers: list, start_at: int, max_results: int, fields: str) -> dict:
+        size = min(max_results, self.page_size)
+        return {
+            "startAt": start_at,
+            "maxResults": size,
+            "total": len(numbers),
+            "issues": [self.issue(number, fields) for number in numbers[start_at:start_at + size]],
+        }
+
+    def edit(self, number: int, fields: dict) -> None:
+        """Store fields written with PUT issue and bump the issue's updated time"""
+        now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000+0000")
+        with self._lock:
+            self.edits[number] = {**self.edits.get(number, {}), **fields, "updated": now}
+
+    def search(self, jql: str) -> list:
+        """Issue numbers matching the JQL.
+
+        Understands `sprint = N` and clauses joined by AND on project, key, status, assignee, labels, created and
+        updated with =, !=, IN, NOT IN, IS [NOT] EMPTY and date comparisons, plus ORDER BY; other clauses match all"""
+        jql = jql or ""
+        if re.search(r"\bsprint\s*=", jql, re.IGNORECASE):
+            return self.sprint_issues()
+        where, order = (re.split(r"\border\s+by\b", jql, maxsplit=1, flags=re.IGNORECASE) + [""])[:2]
+        clauses = []
+        for clause in filter(None, (part.strip() for part in re.split(r"\s+and\s+", where, flags=re.IGNORECASE))):
+            match = re.fullmatch(r"(\w+)\s*(!=|>=|<=|=|>|<|not\s+in\b|in\b|is\s+not\b|is\b)\s*(.*)", clause, re.IGNORECASE | re.DOTALL)
+            if match and match.group(1).lower() in _FIELD_VALUES:
+                values = re.findall(r"\"[^\"]*\"|'[^']*'|[^\s,()]+\(\)|[^\s,()]+", match.group(3))
+                clauses.append((match.group(1).lower(), " ".join(match.group(2).lower().split()), [_operand(match.group(1).lower(), value) for value in values]))
+        terms = [term.split() for term in order.split(",") if term.strip()]
+        numbers = list(range(1, self.issues + 1))
+        if not clauses and not terms:
+            return numbers
+
+        fields = lru_cache(maxsize=None)(lambda number: self.issue(number, "status,assignee,labels,created,updated")["fields"])
+        for field, operator, values in clauses:
+            numbers = [number for number in numbers if _matches(_FIELD_VALUES[field](number, fields), operator, values)]
+        for term in reversed(terms):
+            field = term[0].lower()
+            numbers.sort(key=lambda number: _FIELD_VALUES[field](number, fields)[0], reverse=len(term) > 1 and term[1].lower() == "desc")
+        return numbers
+
+    def sprint_issues(self) -> list:
+        return list(range(1, min(self.issues, 200) + 1))
+
+
+def _timestamp(value: str) -> datetime:
+    return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f%z")
+
+
+# JQL field -> (issue number, fields of an issue number) -> values it matches against (lists for multi-valued fields)
+_FIELD_VALUES = {
+    "project": lambda number, fields: [PROJECT.lower()],
+    "key": lambda number, fields: [(PROJECT.lower(), number)],
+    "status": lambda number, fields: [fields(number)["status"]["name"].lower()],
+    "assignee": lambda number, fields: [value.lower() for value in (fields(number)["assignee"] or {}).values()],
+    "labels": lambda number, fields: [label.lower() for label in fields(number)["labels"]],
+    "created": lambda number, fields: [_timestamp(fields(number)["created"])],
+    "updated": lambda number, fields: [_timestamp(fields(number)["updated"])],
+}
+
+
+def _operand(field: str, text: str):
+    """One JQL value for a field: a date, an issue key, currentUser() or a lower-cased string"""
+    text = text.strip("'\"")
+    if text.lower() == "currentuser()":
+        return ME["accountId"]
+    if field in ("created", "updated"):
+        relative = re.fullmatch(r"([-+]?\d+)([mhdw])", text)
+        if relative:
+            unit = {"m": "minutes", "h": "hours", "d": "days", "w": "weeks"}[relative.group(2)]
+            return datetime.now(timezone.utc) + timedelta(**{unit: int(relative.group(1))})
+        for date_format in ("%Y-%m-%d %H:%M", "%Y/%m/%d %H:%M", "%Y-%m-%d", "%Y/%m/%d"):
+            try:
+                return datetime.strptime(text, date_format).replace(tzinfo=timezone.utc)
+            except ValueError:
+                pass
+    if field == "key":
+        project, _, number = text.rpartition("-")
+        return project.lower(), int(number)
+    return text.lower()
+
+
+def _matches(actual: list, operator: str, values: list) -> bool:
+    if operator in ("is", "is not"):
+        return bool(actual) == (operator == "is not")
+    if operator in (">=", "<=", ">", "<"):
+        return any({">=": a >= v, "<=": a <= v, ">": a > v, "<": a < v}[operator] for a in actual for v in values)
+    found = any(value in actual for value in values)
+    if operator in ("!=", "not in"):
+        # Like Jira, negations do not match issues where the field is empty
+        return bool(actual) and not found
+    return found
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def _send(self, body, status: int = 200, headers: dict = None) -> None:
+        data = b"" if body is None else json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _body(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        data = self.rfile.read(length) if length else b""
+        try:
+            return json.loads(data) if data else {}
+        except ValueError:
+            return {}
+
+    def _handle(self, method: str) -> None:
+        fake = self.server.fake
+        url = urlparse(self.path)
+        # python-jira sends a fields list as repeated parameters
+        query = {name: ",".join(values) if name == "fields" else values[-1] for name, values in parse_qs(url.query).items()}
+        body = self._body() if method in ("POST", "PUT") else {}
+        path = re.sub(r"^/rest/(api/2|agile/1\.0)/", "", url.path)
+
+        route, handler = None, None
+        for pattern, methods, name in ROUTES:
+            match = re.fullmatch(pattern, path)
+            if match and method in methods:
+                route, handler = f"{method} {name}", getattr(self, "_" + name.replace("/", "_"))
+                break
+        if route is None:
+            fake.record(f"{method} unknown")
+            return self._send({"errorMessages": [f"No fake for {method} {url.path}"]}, 404)
+
+        throttled = fake.record(route)
+        if fake.latency:
+            time.sleep(fake.latency)
+        if throttled:
+            return self._send({"errorMessages": ["Rate limit exceeded"]}, 429, {"Retry-After": str(fake.retry_after)})
+        status, response = handler(fake, query, body, *match.groups())
+        self._send(response, status)
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_PUT(self):
+        self._handle("PUT")
+
+    # Endpoints: (fake, query, body, *path groups) -> (status, json)
+
+    def _serverInfo(self, fake, query, body):
+        return 200, {"version": "9.12.0", "versionNumbers": [9, 12, 0], "deploymentType": "Server", "baseUrl": fake.url}
+
+    def _myself(self, fake, query, body):
+        return 200, ME
+
+    def _field(self, fake, query, body):
+        return 200, FIELDS
+
+    def _priority(self, fake, query, body):
+        return 200, [{"id": str(index), "name": name} for index, name in enumerate(["Highest", "High", "Medium", "Low", "Lowest"], 1)]
+
+    def _issuetype(self, fake, query, body):
+        return 200, [{"id": "1", "name": "Bug"}, {"id": "2", "name": "Story"}, {"id": "3", "name": "Task"}]
+
+    def _status(self, fake, query, body):
+        return 200, [{"id": str(index), "name": name, "statusCategory": {"key": key}} for index, (name, key) in enumerate(STATUSES, 1)]
+
+    def _project(self, fake, query, body):
+        return 200, [{"id": "10000", "key": PROJECT, "name": "Benchmark"}]
+
+    def _search(self, fake, query, body):
+        params = {**query, **body}
+        numbers = fake.search(params.get("jql", ""))
+        fields = params.get("fields")
+        if isinstance(fields, list):
+            fields = ",".join(fields)
+        return 200, fake.page(numbers, int(params.get("startAt", 0)), int(params.get("maxResults", 50)), fields)
+
+    def _issue(self, fake, query, body, key):
+        number = fake.number_of(key)
+        if not 1 <= number <= fake.issues:
+            return 404, {"errorMessages": ["Issue does not exist or you do not have permission to see it."]}
+        if body:
+            fake.edit(number, body.get("fields") or {})
+            return 204, None
+        return 200, fake.issue(number, query.get("fields"))
+
+    def _issue_comment(self, fake, query, body, key):
+        if body:
+            return 201, {"id": "1", "body": body.get("body"), "created": "2024-05-01T09:00:00.000+0000"}
+        comments = [{"id": str(index), "author": {"displayName": USERS[index % len(USERS)]}, "body": f"Comment {index}", "created": "2024-05-01T09:00:00.000+0000"} for index in range(3)]
+        return 200, {"startAt": 0, "maxResults": len(comments), "total": len(comments), "comments": comments}
+
+    def _issue_worklog(self, fake, query, body, key):
+        worklogs = fake.worklogs(fake.number_of(key))
+        start_at = int(query.get("startAt", 0))
+        size = min(int(query.get("maxResults", 1000)), fake.page_size)
+        return 200, {"startAt": start_at, "maxResults": size, "total": len(worklogs), "worklogs": worklogs[start_at:start_at + size]}
+
+    def _worklog_updated(self, fake, query, body):
+        ids = [int(worklog["id"]) for number in range(1, fake.issues + 1) for worklog in fake.worklogs(number)]
+        offset = int(query.get("since", 0)) if int(query.get("since", 0)) < len(ids) else 0
+        page = ids[offset:offset + 1000]
+        return 200, {"values": [{"worklogId": worklog_id} for worklog_id in page], "since": offset, "until": offset + len(page), "lastPage": offset + 1000 >= len(ids)}
+
+    def _worklog_list(self, fake, query, body):
+        return 200, [fake.worklogs(worklog_id // 100)[worklog_id % 100] for worklog_id in map(int, body.get("ids", []))]
+
+    def _board_configuration(self, fake, query, body, board_id):
+        return 200, {"id": int(board_id), "estimation": {"type": "field", "field": {"fieldId": STORY_POINTS, "displayName": "Story Points"}}}
+
+    def _board_sprint(self, fake, query, body, board_id):
+        return 200, {"startAt": 0, "maxResults": 50, "isLast": True, "values": [{"id": SPRINT_ID, "name": "Sprint 1", "state": "active"}]}
+
+    def _sprint(self, fake, query, body, sprint_id):
+        return 200, {"id": int(sprint_id), "name": f"Sprint {sprint_id}", "state": "active", "goal": "Benchmark"}
+
+    def _sprint_issue(self, fake, query, body, sprint_id):
+        return 200, fake.page(fake.sprint_issues(), int(query.get("startAt", 0)), int(query.get("maxResults", 50)), query.get("fields"))
+
+
+# (path regex relative to the REST base, methods, route name); the route name selects the _handler
+ROUTES = [
+    (r"serverInfo", ("GET",), "serverInfo"),
+    (r"myself", ("GET",), "myself"),
+    (r"field", ("GET",), "field"),
+    (r"priority", ("GET",), "priority"),
+    (r"issuetype", ("GET",), "issuetype"),
+    (r"status", ("GET",), "status"),
+    (r"project", ("GET",), "project"),
+    (r"search", ("GET", "POST"), "search"),
+    (r"issue/([^/]+)/comment", ("GET", "POST"), "issue/comment"),
+    (r"issue/([^/]+)/worklog", ("GET",), "issue/worklog"),
+    (r"issue/([^/]+)", ("GET", "PUT"), "issue"),
+    (r"worklog/updated", ("GET",), "worklog/updated"),
+    (r"worklog/list", ("POST",), "worklog/list"),
+    (r"board/(\d+)/configuration", ("GET",), "board/configuration"),
+    (r"board/(\d+)/sprint", ("GET",), "board/sprint"),
+    (r"sprint/(\d+)/issue", ("GET",), "sprint/issue"),
+    (r"sprint/(\d+)", ("GET",), "sprint"),
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--issues", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds added to every request")
+    parser.add_argument("--page-size", type=int, default=100, help="largest page the server returns")
+    parser.add_argument("--payload-bytes", type=int, default=1024, help="description size per issue")
+    parser.add_argument("--throttle-every", type=int, default=0, help="answer every Nth request with 429 (0 disables)")
+    parser.add_argument("--retry-after", type=float, default=0.0)
+    args = parser.parse_args()
+
+    fake = FakeJira(issues=args.issues, latency=args.latency, page_size=args.page_size, payload_bytes=args.payload_bytes,
+                    throttle_every=args.throttle_every, retry_after=args.retry_after, port=args.port).start()
+    print(f"Fake Jira listening on {fake.url} (JIRA_HOST={fake.url})")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        fake.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+"""Tool benchmark: latency, throughput, upstream calls and peak RSS of the MCP tools against a fake Jira server.
+
+Each scenario issues --calls tool calls with N callers in flight at once over one MCP session, for every N in --concurrency.
+The session is either in-process (memory streams) or the real stdio transport to a spawned server. Results are printed and
+optionally written as JSON; --baseline compares against an earlier results file and fails on regressions.
+
+    uv run python benchmarks/load.py --concurrency 1,8,32 --latency 0.05 --output bench.json
+    uv run python benchmarks/load.py --transport stdio --baseline bench.json --max-regression 0.2
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+from fakejira import FakeJira
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# name -> function building (tool, arguments) for the n-th call of the scenario
+SCENARIOS = {
+    "get_issue": lambda n: ("get_issue", {"issue_key": f"BENCH-{n % 500 + 1}", "fields": "summary,status,assignee"}),
+    "get_issue_hot": lambda n: ("get_issue", {"issue_key": "BENCH-1", "fields": "summary,status,assignee"}),
+    "search_issues": lambda n: ("search_issues", {"query": "project = BENCH", "start_at": n * 50 % 900, "max_results": 50, "fields": "summary,status"}),
+    "search_all_issues": lambda n: ("search_all_issues", {"query": "project = BENCH", "max_rows": 1000, "fields": "summary,status"}),
+    "get_issues": lambda n: ("get_issues", {"issue_keys": [f"BENCH-{n * 50 % 900 + i}" for i in range(1, 51)], "fields": "summary,status"}),
+    "get_fields": lambda n: ("get_fields", {}),
+    "update_issues": lambda n: ("update_issues", {"updates": {f"BENCH-{(n * 10 + i) % 1000 + 1}": {"labels": ["bench"]} for i in range(10)}}),
+    "sprint_snapshot": lambda n: ("get_sprint_snapshot", {"board_id": 1, "include_issues": False}),
+    "collect_worklogs": lambda n: ("collect_worklogs", {"jql": "project = BENCH", "since": "2024-05-01", "until": "2024-05-31"}),
+}
+
+
+def server_env(fake: FakeJira, overrides: list[str]) -> dict:
+    """Environment for the server under test: the fake Jira, no mirror or persistent cache, plus KEY=VALUE overrides"""
+    env = {
+        **os.environ,
+        "JIRA_HOST": fake.url,
+        "JIRA_EMAIL": "bench@example.com",
+        "JIRA_TOKEN": "bench",
+        "JIRA_WARMUP": "",
+        "JIRA_MIRROR_PROJECTS": "",
+        "JIRA_CACHE_PATH": "",
+    }
+    for override in overrides:
+        name, _, value = override.partition("=")
+        env[name] = value
+    return env
+
+
+@asynccontextmanager
+async def open_session(transport: str, env: dict):
+    """A connected ClientSession to the server in main.py"""
+    if transport == "memory":
+        os.environ.update(env)
+        sys.path.insert(0, str(ROOT))
+        import main
+        # Keep per-request INFO logging off the harness output; over stdio it goes to /dev/null
+        logging.getLogger().setLevel(logging.WARNING)
+        from mcp.shared.memory import create_connected_server_and_client_session
+        async with create_connected_server_and_client_session(main.mcp._mcp_server) as session:
+            yield session
+        return
+
+    from mcp import ClientSession, StdioServerParameters
+    from mcp.client.stdio import stdio_client
+    params = StdioServerParameters(command=sys.executable, args=["-c", "import main; main.mcp.run()"], cwd=str(ROOT), env=env)
+    with open(os.devnull, "w") as errlog:
+        async with stdio_client(params, errlog=errlog) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                yield session
+
+
+def percentile(values: list[float], q: float) -> float:
+    """q-th percentile (0-100) with linear interpolation"""
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return ordered[0]
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+async def run_level(session, fake: FakeJira, scenario, calls: int, concurrency: int) -> dict:
+    """Issue `calls` calls with `concurrency` callers in flight and summarize them"""
+    latencies = []
+    errors = 0
+    counter = iter(range(calls))
+
+    async def caller():
+        nonlocal errors
+        for n in counter:
+            name, arguments = scenario(n)
+            start = time.perf_counter()
+            try:
+                result = await session.call_tool(name, arguments)
+                errors += bool(result.isError)
+            except Exception:
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+
+    fake.reset_counts()
+    start = time.perf_counter()
+    await asyncio.gather(*(caller() for _ in range(concurrency)))
+    wall = time.perf_counter() - start
+    upstream = fake.counts()
+    return {
+        "concurrency": concurrency,
+        "calls": calls,
+        "errors": errors,
+        "wall_s": round(wall, 4),
+        "throughput_per_s": round(calls / wall, 2),
+        "latency_ms": {
+            "p50": round(percentile(latencies, 50) * 1000, 2),
+            "p90": round(percentile(latencies, 90) * 1000, 2),
+            "p99": round(percentile(latencies, 99) * 1000, 2),
+            "mean": round(statistics.fmean(latencies) * 1000, 2),
+            "max": round(max(latencies) * 1000, 2),
+        },
+        "upstream": {
+            "total": upstream["total"],
+            "per_call": round(upstream["total"] / calls, 2),
+            "throttled": upstream["throttled"],
+            "routes": upstream["routes"],
+        },
+    }
+
+
+def peak_rss_mb(who: int) -> float:
+    """Peak resident set size of this process or of its finished children (ru_maxrss is KiB on Linux, bytes on macOS)"""
+    peak = resource.getrusage(who).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+async def run(args) -> dict:
+    fake = FakeJira(issues=args.issues, latency=args.latency, page_size=args.page_size, payload_bytes=args.payload_bytes,
+                    throttle_every=args.throttle_every, retry_after=args.retry_after).start()
+    levels = [int(level) for level in args.concurrency.split(",")]
+    names = args.scenarios.split(",") if args.scenarios else list(SCENARIOS)
+    results = {}
+    try:
+        async with open_session(args.transport, server_env(fake, args.env)) as session:
+            for name in names:
+                scenario = SCENARIOS[name]
+                if args.warmup:
+                    tool, arguments = scenario(0)
+                    await session.call_tool(tool, arguments)
+                results[name] = [await run_level(session, fake, scenario, args.calls, level) for level in levels]
+                print(f"{name}: " + ", ".join(f"c={r['concurrency']} p50={r['latency_ms']['p50']}ms p99={r['latency_ms']['p99']}ms "
+                                               f"{r['throughput_per_s']}/s upstream/call={r['upstream']['per_call']}" for r in results[name]), file=sys.stderr)
+    finally:
+        fake.stop()
+
+    in_process = args.transport == "memory"
+    return {
+        "benchmark": "tools",
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "transport": args.transport,
+        "fake_jira": {"issues": args.issues, "latency_s": args.latency, "page_size": args.page_size, "payload_bytes": args.payload_bytes,
+                      "throttle_every": args.throttle_every, "retry_after_s": args.retry_after},
+        "calls": args.calls,
+        "env": args.env,
+        "scenarios": results,
+        # In-process the peak includes the harness and the fake server; over stdio it is the server process alone
+        "peak_rss_mb": {"scope": "process" if in_process else "server", "value": peak_rss_mb(resource.RUSAGE_SELF if in_process else resource.RUSAGE_CHILDREN)},
+    }
+
+
+def compare(results: dict, baseline: dict, max_regression: float) -> list[str]:
+    """Regressions of p50 latency, throughput or upstream calls per call beyond max_regression (a fraction)"""
+    regressions = []
+    for name, levels in results["scenarios"].items():
+        previous = {level["concurrency"]: level for level in baseline.get("scenarios", {}).get(name, [])}
+        for level in levels:
+            before = previous.get(level["concurrency"])
+            if before is None:
+                continue
+            checks = [
+                ("p50 latency", before["latency_ms"]["p50"], level["latency_ms"]["p50"], True),
+                ("throughput", before["throughput_per_s"], level["throughput_per_s"], False),
+                ("upstream calls per call", before["upstream"]["per_call"], level["upstream"]["per_call"], True),
+            ]
+            for label, old, new, lower_is_better in checks:
+                if old:
+                    change = (new - old) / old
+                else:
+                    # Any increase over a zero baseline, e.g. upstream calls of a fully cached call, is unbounded
+                    change = float("inf") if new > 0 else 0.0
+                print(f"{name} c={level['concurrency']} {label}: {old} -> {new} ({change:+.1%})", file=sys.stderr)
+                if (change if lower_is_better else -change) > max_regression:
+                    regressions.append(f"{name} c={level['concurrency']} {label} regressed {abs(change):.1%} ({old} -> {new})")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transport", choices=["memory", "stdio"], default="memory")
+    parser.add_argument("--scenarios", default=None, help=f"comma separated subset of: {', '.join(SCENARIOS)}")
+    parser.add_argument("--calls", type=int, default=100, help="tool calls per scenario and concurrency level")
+    parser.add_argument("--concurrency", default="1,8", help="comma separated numbers of callers in flight")
+    parser.add_argument("--no-warmup", dest="warmup", action="store_false", help="do not make one unmeasured call per scenario first")
+    parser.add_argument("--issues", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds the fake Jira adds to every request")
+    parser.add_argument("--page-size", type=int, default=100, help="largest page the fake Jira returns")
+    parser.add_argument("--payload-bytes", type=int, default=1024, help="description size per issue")
+    parser.add_argument("--throttle-every", type=int, default=0, help="answer every Nth upstream request with 429 (0 disables)")
+    parser.add_argument("--retry-after", type=float, default=0.0, help="Retry-After seconds sent with injected 429s")
+    parser.add_argument("--env", action="append", default=[], metavar="KEY=VALUE", help="extra server configuration, e.g. JIRA_COALESCE=false")
+    parser.add_argument("--output", default=None, help="write results as JSON to this file")
+    parser.add_argument("--baseline", default=None, help="results JSON of an earlier run to compare against")
+    parser.add_argument("--max-regression", type=float, default=None, help="with --baseline, fail when a metric regresses by more than this fraction")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    print(json.dumps(results, indent=2))
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+
+    if args.baseline:
+        regressions = compare(results, json.loads(Path(args.baseline).read_text()), args.max_regression or 0.0)
+        if args.max_regression is not None and regressions:
+            for regression in regressions:
+                print(regression, file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
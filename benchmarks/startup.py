@@ -0,0 +1,87 @@
+"""Startup benchmark: import time of main.py and time from process launch to the first tools/list response.
+
+Jira is pointed at an unreachable address, so any network call during startup shows up as a failure or a stall.
+
+    uv run python benchmarks/startup.py --runs 5 --max-first-list 3.0
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+ROOT = Path(__file__).resolve().parent.parent
+
+ENV = {
+    **os.environ,
+    "JIRA_HOST": "http://127.0.0.1:9",
+    "JIRA_EMAIL": "bench@example.com",
+    "JIRA_TOKEN": "bench",
+    "JIRA_WARMUP": "",
+}
+
+
+def measure_import() -> float:
+    """Seconds for a fresh interpreter to import main"""
+    code = "import time; t = time.perf_counter(); import main; print(time.perf_counter() - t)"
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=ENV, capture_output=True, text=True, check=True)
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+async def measure_first_list() -> tuple[float, int]:
+    """Seconds from spawning the stdio server to receiving its tool list, and the number of tools"""
+    params = StdioServerParameters(command=sys.executable, args=["-c", "import main; main.mcp.run()"], cwd=str(ROOT), env=ENV)
+    start = time.perf_counter()
+    with open(os.devnull, "w") as errlog:
+        async with stdio_client(params, errlog=errlog) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                tools = await session.list_tools()
+                return time.perf_counter() - start, len(tools.tools)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-import", type=float, default=None, help="fail if median import time exceeds this many seconds")
+    parser.add_argument("--max-first-list", type=float, default=None, help="fail if median time to first tools/list exceeds this many seconds")
+    parser.add_argument("--output", default=None, help="write results as JSON to this file")
+    args = parser.parse_args()
+
+    import_times = [measure_import() for _ in range(args.runs)]
+    list_times = []
+    tool_count = 0
+    for _ in range(args.runs):
+        elapsed, tool_count = asyncio.run(measure_first_list())
+        list_times.append(elapsed)
+
+    results = {
+        "benchmark": "startup",
+        "runs": args.runs,
+        "tools": tool_count,
+        "import_s": {"median": statistics.median(import_times), "min": min(import_times), "max": max(import_times)},
+        "first_list_s": {"median": statistics.median(list_times), "min": min(list_times), "max": max(list_times)},
+    }
+    print(json.dumps(results, indent=2))
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+
+    failed = False
+    if args.max_import is not None and results["import_s"]["median"] > args.max_import:
+        print(f"import time {results['import_s']['median']:.3f}s exceeds {args.max_import}s", file=sys.stderr)
+        failed = True
+    if args.max_first_list is not None and results["first_list_s"]["median"] > args.max_first_list:
+        print(f"time to first tools/list {results['first_list_s']['median']:.3f}s exceeds {args.max_first_list}s", file=sys.stderr)
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+import inspect
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Optional
+
+from config import config
+from sites import SiteLocal
+
+
+class MetadataCache:
+    """TTL + LRU cache for rarely changing Jira metadata (fields, types, projects, ...)"""
+
+    def __init__(self, default_ttl: float = 3600, ttls: Optional[dict] = None, max_entries: int = 256, path: str = ""):
+        self.default_ttl = default_ttl
+        self.ttls = ttls or {}
+        self.max_entries = max_entries
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._load()
+
+    @staticmethod
+    def make_key(resource: str, *args) -> str:
+        """Build the cache key for a resource and its arguments"""
+        return ":".join([resource, *(str(arg) for arg in args)])
+
+    def ttl_for(self, resource: str) -> float:
+        """TTL in seconds for a resource, falling back to the default"""
+        return self.ttls.get(resource, self.default_ttl)
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """Return (hit, value) for a key, dropping it if expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.time():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[1]
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store a value, evicting the least recently used entries past max_entries"""
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.time() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            self._save()
+
+    def invalidate(self, resource: str, *args) -> int:
+        """Drop the entry for resource+args, or every entry of the resource when no args are given"""
+        key = self.make_key(resource, *args)
+        with self._lock:
+            if args:
+                stale = [key] if key in self._entries else []
+            else:
+                stale = [k for k in self._entries if k == resource or k.startswith(resource + ":")]
+            for k in stale:
+                del self._entries[k]
+            if stale:
+                self._save()
+            return len(stale)
+
+    def clear(self) -> int:
+        """Drop all entries"""
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+            self._save()
+            return count
+
+    def stats(self) -> dict:
+        """Hit/miss counters and current size"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "persistent": bool(self.path),
+            }
+
+    def cached(self, resource: str):
+        """Decorator caching a function's result under resource + its bound arguments"""
+        def decorator(fn):
+            signature = inspect.signature(fn)
+
+            @wraps(fn)
+            def wrapper(*args, **kwargs):
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                key = self.make_key(resource, *bound.arguments.values())
+                hit, value = self.get(key)
+                if hit:
+                    return value
+                value = fn(*args, **kwargs)
+                self.set(key, value, self.ttl_for(resource))
+                return value
+            return wrapper
+        return decorator
+
+    def _load(self) -> None:
+        """Load unexpired entries persisted by a previous run"""
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        now = time.time()
+        for key, (expires_at, value) in data.items():
+            if expires_at > now:
+                self._entries[key] = (expires_at, value)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _save(self) -> None:
+        """Persist entries to disk (caller holds the lock)"""
+        if not self.path:
+            return
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(dict(self._entries), f, default=str)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
+
+
+class SiteMetadataCache(SiteLocal):
+    """One MetadataCache per Jira site; functions decorated with cached() look up the site on every call"""
+
+    cached = MetadataCache.cached
+
+
+# Global metadata cache proxy, isolated per site
+metadata_cache = SiteMetadataCache(lambda site: MetadataCache(
+    default_ttl=config.cache_ttl,
+    ttls=config.cache_ttls,
+    max_entries=config.cache_max_entries,
+    path=site.cache_path,
+))
@@ -0,0 +1,88 @@
+import threading
+from functools import partial
+from typing import TYPE_CHECKING
+
+from config import SiteConfig, config
+from metrics import metrics
+from ratelimit import scheduler
+from sites import SiteLocal
+
+if TYPE_CHECKING:
+    from jira import JIRA
+
+# Server version and deployment type by site name
+_server_info: dict[str, dict] = {}
+_server_info_lock = threading.Lock()
+
+
+def create_client(site: SiteConfig = None) -> "JIRA":
+    """Create a JIRA client for a site with its own HTTP session and connection pool.
+    Server version detection runs once per site; later clients reuse its result.
+    Requests go through the site's rate limiting scheduler.
+    jira and requests are imported here so server startup does not pay for them"""
+    from jira import JIRA
+    from transport import ThrottledAdapter
+
+    site = site or config.site()
+    site.validate()
+
+    def build(get_server_info: bool) -> JIRA:
+        return JIRA(
+            options={
+                "server": site.host,
+            },
+            token_auth=site.token,
+            timeout=config.http_timeout,
+            # Retries are done by ThrottledAdapter, which knows which requests are safe to repeat
+            max_retries=0,
+            get_server_info=get_server_info,
+        )
+
+    client = None
+    if site.name not in _server_info:
+        with _server_info_lock:
+            if site.name not in _server_info:
+                client = build(get_server_info=True)
+                _server_info[site.name] = {"version": client._version, "deploymentType": client.deploymentType}
+    if client is None:
+        info = _server_info[site.name]
+        client = build(get_server_info=False)
+        client._version = info["version"]
+        client.deploymentType = info["deploymentType"]
+
+    adapter = ThrottledAdapter(
+        scheduler.for_site(site.name),
+        retries=config.max_retries,
+        base_delay=config.retry_base_delay,
+        max_delay=config.retry_max_delay,
+        pool_connections=1,
+        pool_maxsize=config.http_pool_size,
+        on_response=metrics.record_upstream,
+    )
+    client._session.mount("https://", adapter)
+    client._session.mount("http://", adapter)
+    return client
+
+
+class ThreadLocalClient:
+    """Proxy forwarding attribute access to a JIRA client owned by the calling thread,
+    so worker threads never share a requests session"""
+
+    def __init__(self, factory=create_client):
+        self._factory = factory
+        self._local = threading.local()
+
+    def get(self) -> "JIRA":
+        """Return the calling thread's client, creating it on first use"""
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = self._local.client = self._factory()
+        return client
+
+    def __getattr__(self, name):
+        return getattr(self.get(), name)
+
+
+def site_clients() -> SiteLocal:
+    """Client proxy routing each call to a per-thread client of the current tool call's site"""
+    return SiteLocal(lambda site: ThreadLocalClient(partial(create_client, site)))
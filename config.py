@@ -3,6 +3,29 @@ from typing import Optional
 from dotenv import load_dotenv
 
 
+class SiteConfig:
+    """Connection settings of one Jira site"""
+    
+    def __init__(self, name: str, host: str, email: str, token: str, rate_limit: float, max_concurrency: int, cache_path: str, env_prefix: str = "JIRA_"):
+        self.name = name
+        self.host = host
+        self.email = email
+        self.token = token
+        self.rate_limit = rate_limit
+        self.max_concurrency = max_concurrency
+        self.cache_path = cache_path
+        # Prefix of the environment variables the site is configured with, for error messages
+        self.env_prefix = env_prefix
+    
+    def validate(self) -> None:
+        """Validate that the site has a host and credentials.
+        Called when the site's first Jira client is created rather than at import, so the server
+        can start and list its tools before credentials are checked"""
+        missing = [self.env_prefix + name for name, value in (("EMAIL", self.email), ("HOST", self.host), ("TOKEN", self.token)) if not value]
+        if missing:
+            raise ValueError(f"Jira site {self.name!r} is missing required environment variables: {', '.join(missing)}")
+
+
 class JiraConfig:
     """Configuration for Jira integration"""
     
@@ -15,21 +38,116 @@ class JiraConfig:
         self.token: Optional[str] = os.getenv("JIRA_TOKEN", "")
         self.context: str = os.getenv("JIRA_CONTEXT", "")
         
-        # Validate required configuration
-        self._validate()
+        # Metadata cache settings
+        self.cache_ttl: float = float(os.getenv("JIRA_CACHE_TTL", "3600"))
+        self.cache_ttls: dict[str, float] = self._parse_ttls(os.getenv("JIRA_CACHE_TTLS", ""))
+        self.cache_max_entries: int = int(os.getenv("JIRA_CACHE_MAX_ENTRIES", "256"))
+        self.cache_path: str = os.getenv("JIRA_CACHE_PATH", "")
+        
+        # Response size budget for list tools (0 disables)
+        self.response_max_bytes: int = int(os.getenv("JIRA_RESPONSE_MAX_BYTES", "100000"))
+        
+        # Paginated search settings
+        self.search_page_size: int = int(os.getenv("JIRA_SEARCH_PAGE_SIZE", "100"))
+        self.search_prefetch: int = int(os.getenv("JIRA_SEARCH_PREFETCH", "4"))
+        
+        # Batch operation settings
+        self.batch_concurrency: int = int(os.getenv("JIRA_BATCH_CONCURRENCY", "8"))
+        self.batch_search_size: int = int(os.getenv("JIRA_BATCH_SEARCH_SIZE", "100"))
+        self.batch_create_size: int = int(os.getenv("JIRA_BATCH_CREATE_SIZE", "50"))
+        
+        # Execution settings
+        self.max_concurrency: int = int(os.getenv("JIRA_MAX_CONCURRENCY", "8"))
+        self.io_workers: int = int(os.getenv("JIRA_IO_WORKERS", "16"))
+        self.tool_timeout: float = float(os.getenv("JIRA_TOOL_TIMEOUT", "120"))
+        self.http_timeout: float = float(os.getenv("JIRA_HTTP_TIMEOUT", "30"))
+        self.http_pool_size: int = int(os.getenv("JIRA_HTTP_POOL_SIZE", "4"))
+        self.warmup: bool = os.getenv("JIRA_WARMUP", "").lower() in ("1", "true", "yes")
+        
+        # Rate limiting and retry settings
+        self.rate_limit: float = float(os.getenv("JIRA_RATE_LIMIT", "0"))
+        self.rate_limit_min: float = float(os.getenv("JIRA_RATE_LIMIT_MIN", "0.5"))
+        self.rate_limit_max: float = float(os.getenv("JIRA_RATE_LIMIT_MAX", "100"))
+        self.rate_burst: int = int(os.getenv("JIRA_RATE_BURST", "10"))
+        self.write_concurrency: int = int(os.getenv("JIRA_WRITE_CONCURRENCY", "4"))
+        self.max_retries: int = int(os.getenv("JIRA_MAX_RETRIES", "4"))
+        self.retry_base_delay: float = float(os.getenv("JIRA_RETRY_BASE_DELAY", "0.5"))
+        self.retry_max_delay: float = float(os.getenv("JIRA_RETRY_MAX_DELAY", "30"))
+        
+        # Request coalescing for read-only tools
+        self.coalesce: bool = os.getenv("JIRA_COALESCE", "true").lower() in ("1", "true", "yes")
+        self.coalesce_window: float = float(os.getenv("JIRA_COALESCE_WINDOW", "0"))
+        
+        # Local issue mirror settings
+        self.mirror_projects: list[str] = [p for p in os.getenv("JIRA_MIRROR_PROJECTS", "").split(",") if p.strip()]
+        self.mirror_path: str = os.getenv("JIRA_MIRROR_PATH", "jira-mirror.sqlite3")
+        self.mirror_fields: str = os.getenv("JIRA_MIRROR_FIELDS", "*navigable")
+        self.mirror_sync_interval: float = float(os.getenv("JIRA_MIRROR_SYNC_INTERVAL", "300"))
+        self.mirror_max_staleness: float = float(os.getenv("JIRA_MIRROR_MAX_STALENESS", "900"))
+        
+        # Attachment transfer settings
+        self.attachment_max_bytes: int = int(os.getenv("JIRA_ATTACHMENT_MAX_BYTES", str(1024 ** 3)))
+        self.attachment_chunk_size: int = int(os.getenv("JIRA_ATTACHMENT_CHUNK_SIZE", str(1024 ** 2)))
+        self.attachment_inline_max_bytes: int = int(os.getenv("JIRA_ATTACHMENT_INLINE_MAX_BYTES", str(1024 ** 2)))
+        self.attachment_concurrency: int = int(os.getenv("JIRA_ATTACHMENT_CONCURRENCY", "4"))
+        # Transfers run as long as they keep making progress, so they are not bound by JIRA_TOOL_TIMEOUT
+        self.attachment_timeout: float = float(os.getenv("JIRA_ATTACHMENT_TIMEOUT", "0"))
+        
+        # Worklog collection
+        self.worklog_bulk_threshold: int = int(os.getenv("JIRA_WORKLOG_BULK_THRESHOLD", "50"))
+        
+        # Jira sites served by this process; JIRA_HOST/JIRA_EMAIL/JIRA_TOKEN configure the default site
+        self.default_site: str = os.getenv("JIRA_DEFAULT_SITE", "")
+        self.sites: dict[str, SiteConfig] = self._parse_sites(os.getenv("JIRA_SITES", ""))
+
     
-    def _validate(self) -> None:
-        """Validate that all required configuration is present"""
-        missing = []
-        
-        if not self.email:
-            missing.append("JIRA_EMAIL")
-        if not self.host:
-            missing.append("JIRA_HOST")
-        if not self.token:
-            missing.append("JIRA_TOKEN")
-        if missing:
-            raise ValueError(f"Missing required environment variables: {', '.join(missing)}")
+    def _parse_sites(self, value: str) -> dict[str, SiteConfig]:
+        """Build the site table from JIRA_SITES='cloud,dc1' and JIRA_SITE_<NAME>_HOST/_EMAIL/_TOKEN,
+        with optional JIRA_SITE_<NAME>_RATE_LIMIT, _MAX_CONCURRENCY and _CACHE_PATH overrides"""
+        names = [name.strip() for name in value.split(",") if name.strip()]
+        if self.host or not names:
+            self.default_site = self.default_site or "default"
+        else:
+            self.default_site = self.default_site or names[0]
+        
+        sites = {}
+        if self.host or not names:
+            sites[self.default_site] = SiteConfig(self.default_site, self.host, self.email, self.token, self.rate_limit, self.max_concurrency, self.cache_path)
+        for name in names:
+            prefix = f"JIRA_SITE_{name.upper().replace('-', '_')}_"
+            root, ext = os.path.splitext(self.cache_path)
+            sites[name] = SiteConfig(
+                name,
+                os.getenv(prefix + "HOST", ""),
+                os.getenv(prefix + "EMAIL", ""),
+                os.getenv(prefix + "TOKEN", ""),
+                float(os.getenv(prefix + "RATE_LIMIT", str(self.rate_limit))),
+                int(os.getenv(prefix + "MAX_CONCURRENCY", str(self.max_concurrency))),
+                # Each site persists its metadata cache to its own file
+                os.getenv(prefix + "CACHE_PATH", f"{root}.{name}{ext}" if self.cache_path else ""),
+                prefix,
+            )
+        if self.default_site not in sites:
+            raise ValueError(f"JIRA_DEFAULT_SITE {self.default_site!r} is not one of the configured sites: {', '.join(sites)}")
+        return sites
+    
+    def site(self, name: Optional[str] = None) -> SiteConfig:
+        """Settings of a configured site, the default site when name is empty"""
+        name = name or self.default_site
+        if name not in self.sites:
+            raise ValueError(f"Unknown Jira site {name!r}; configured sites: {', '.join(self.sites)}")
+        return self.sites[name]
+    
+    @staticmethod
+    def _parse_ttls(value: str) -> dict[str, float]:
+        """Parse per-resource TTLs in the form 'fields=86400,projects=600'"""
+        ttls = {}
+        for item in value.split(","):
+            if not item.strip():
+                continue
+            resource, _, ttl = item.partition("=")
+            ttls[resource.strip()] = float(ttl)
+        return ttls
     
     @property
     def is_configured(self) -> bool:
@@ -1,21 +1,85 @@
-from mcp.server.fastmcp import FastMCP
-from jira import JIRA
-from config import config
-
-mcp = FastMCP("Jira MCP Server")
-
-jira = JIRA(
-    options={
-        "server": config.host,
-    },
-    token_auth=config.token,
-)
+import json
+import re
+from datetime import date
 
-@mcp.tool(title="Search issues", description="Search for issues using JQL (Jira Query Language). Examples: 'project = PROJ AND status = Open', 'assignee = currentUser() AND created >= -7d', 'project = PROJ AND issuetype = Bug AND priority = High', 'parent = EPIC-123'. Common fields: project, assignee, status, priority, created, updated, fixVersion, component", annotations={"readOnlyHint": True})
-def search_issues(query: str, start_at: int, max_results: int) -> list[dict]:
+from config import config
+from client import site_clients
+from mcp.server.fastmcp import Context
+
+import attachments
+from runtime import JiraMCP, report_progress, submit, tool_executor
+from agile import SNAPSHOT_FIELDS, SprintIssuePager, estimation_field, summarize_sprint
+from batch import chunked, run_batch
+from cache import metadata_cache
+from metrics import metrics
+from mirror import MirrorIssue, describe_sync, mirror
+from ratelimit import scheduler
+from singleflight import single_flight
+from sites import is_default_site, site_name
+from pagination import IssuePager, decode_cursor
+from shaping import custom_field_names, encode_list, issue_to_dict, resolve_field_ids, slim
+from worklogs import WorklogReport, collect_bulk, fetch_issue_worklogs, parse_day
+
+mcp = JiraMCP("Jira MCP Server")
+
+# Each worker thread gets its own client and HTTP session per site, created on its first tool call for that site
+jira = site_clients()
+
+@mcp.tool(title="Search issues", description="Search for issues using JQL (Jira Query Language). Examples: 'project = PROJ AND status = Open', 'assignee = currentUser() AND created >= -7d', 'project = PROJ AND issuetype = Bug AND priority = High', 'parent = EPIC-123'. Common fields: project, assignee, status, priority, created, updated, fixVersion, component. Simple queries on mirrored projects are answered from the local mirror and rows then carry synced_at. Returns key and summary by default; fields is a comma separated list of field ids or names (e.g. 'summary,status,assignee,Story Points') to return more, expand e.g. 'renderedFields,changelog'. compact=True drops null and empty values", annotations={"readOnlyHint": True})
+def search_issues(query: str, start_at: int, max_results: int, fields: str = None, expand: str = None, compact: bool = False) -> list[dict]:
     """Search for issues in Jira"""
-    issues = jira.search_issues(query, startAt=start_at, maxResults=max_results)
-    return [{"key": issue.key, "summary": issue.fields.summary} for issue in issues]
+    if not (fields or expand or compact):
+        issues = _search_client(query, "summary").search_issues(query, startAt=start_at, maxResults=max_results, fields="summary")
+        return [_tag_mirrored({"key": issue.key, "summary": issue.fields.summary}, issue) for issue in issues]
+    rest_fields, names = _issue_projection(fields)
+    issues = _search_client(query, rest_fields, expand).search_issues(query, startAt=start_at, maxResults=max_results, fields=rest_fields, expand=expand)
+    return [_tag_mirrored(issue_to_dict(issue.raw, names, compact), issue) for issue in issues]
+
+@mcp.tool(title="Search all issues", description="Search issues with JQL and page through all results automatically in one call. Later pages are fetched in parallel ahead of time. Stops after max_rows issues or max_bytes of response data and returns next_cursor; pass it back as cursor (without query) to continue where the previous call stopped. next_cursor is null when all results were returned. fields, expand and compact work as in search_issues; pass the same values when resuming", annotations={"readOnlyHint": True})
+def search_all_issues(query: str = None, max_rows: int = 1000, max_bytes: int = None, cursor: str = None, fields: str = None, expand: str = None, compact: bool = False) -> dict:
+    """Search issues with automatic pagination and a resumable cursor"""
+    if cursor:
+        query, start_at = decode_cursor(cursor)
+    elif query:
+        start_at = 0
+    else:
+        raise ValueError("Either query or cursor is required")
+    if fields or expand or compact:
+        rest_fields, names = _issue_projection(fields)
+        shape = lambda issue: issue_to_dict(issue.raw, names, compact)
+    else:
+        rest_fields = "summary"
+        shape = lambda issue: {"key": issue.key, "summary": issue.fields.summary}
+    client = _search_client(query, rest_fields, expand)
+    pager = IssuePager(client, query, fields=rest_fields, expand=expand, page_size=config.search_page_size, prefetch=config.search_prefetch)
+    result = pager.collect(start_at, shape, max_rows=max_rows, max_bytes=max_bytes)
+    if client is mirror:
+        result["freshness"] = mirror.freshness(mirror.projects_of(query))
+    return result
+
+def _issue_projection(fields: str = None) -> tuple:
+    """Resolve requested field names to ids and build the custom field id -> name map"""
+    fields_meta = _fields_meta()
+    return resolve_field_ids(fields, fields_meta) or "*all", custom_field_names(fields_meta)
+
+def _search_client(query: str, rest_fields: str = None, expand: str = None):
+    """The local issue mirror when it can answer the query, otherwise Jira"""
+    return mirror if is_default_site() and mirror.covers(query, rest_fields, expand) else jira
+
+def _budget(max_bytes: int = None) -> int:
+    """Response size budget of a list tool: the caller's max_bytes or JIRA_RESPONSE_MAX_BYTES"""
+    return config.response_max_bytes if max_bytes is None else max_bytes
+
+def _tag_mirrored(row: dict, issue) -> dict:
+    """Mark a search row answered from the local mirror with the time its project was last synced"""
+    if isinstance(issue, MirrorIssue):
+        row["synced_at"] = describe_sync(issue.synced_at)["synced_at"]
+    return row
+
+def _mark_written(*issue_keys: str) -> None:
+    """Keep the local mirror from serving issues this server just changed until a sync reloads them"""
+    if mirror.enabled and is_default_site():
+        mirror.mark_stale(issue_keys)
 
 # Server and client information
 @mcp.tool(title="Server info", description="Get information about the Jira server", annotations={"readOnlyHint": True})
@@ -30,6 +94,7 @@ def myself() -> dict:
 
 # Project management
 @mcp.tool(title="Get projects", description="Get list of all accessible projects with keys, names, project types, and lead information. Use this to discover available projects for creating issues or searching", annotations={"readOnlyHint": True})
+@metadata_cache.cached("projects")
 def get_projects() -> list[dict]:
     """Get all projects"""
     projects = jira.projects()
@@ -63,31 +128,39 @@ def create_project(key: str, name: str = None, project_type: str = "software", a
         params.update(additional_params)
     
     result = jira.create_project(**params)
+    metadata_cache.invalidate("projects")
     return {"success": True, "project_id": result}
 
 @mcp.tool(title="Get project components", description="Get components of a project", annotations={"readOnlyHint": True})
+@metadata_cache.cached("project_components")
 def get_project_components(project_key: str) -> list[dict]:
     """Get project components"""
     components = jira.project_components(project_key)
     return [{"id": comp.id, "name": comp.name, "description": getattr(comp, 'description', '')} for comp in components]
 
 @mcp.tool(title="Get project versions", description="Get versions of a project", annotations={"readOnlyHint": True})
+@metadata_cache.cached("project_versions")
 def get_project_versions(project_key: str) -> list[dict]:
     """Get project versions"""
     versions = jira.project_versions(project_key)
     return [{"id": ver.id, "name": ver.name, "released": getattr(ver, 'released', False)} for ver in versions]
 
 # Issue management
-@mcp.tool(title="Get issue", description="Get detailed issue information by key. Returns summary, description, status, assignee, reporter, priority, components, versions, labels, created/updated dates, and all custom fields. Use for getting full issue details", annotations={"readOnlyHint": True})
-def get_issue(issue_key: str) -> dict:
+@mcp.tool(title="Get issue", description="Get detailed issue information by key. Returns summary, description, status, assignee, reporter, priority, components, versions, labels, created/updated dates, and all custom fields. Use for getting full issue details. To keep the response small, pass fields as a comma separated list of field ids or names (e.g. 'summary,status,assignee,Story Points') and/or expand (e.g. 'renderedFields,changelog'); custom field ids are replaced by their names. compact=True drops null and empty values. Issues of mirrored projects are served from the local mirror with a freshness block", annotations={"readOnlyHint": True})
+def get_issue(issue_key: str, fields: str = None, expand: str = None, compact: bool = False) -> dict:
     """Get issue by key"""
-    issue = jira.issue(issue_key)
-    return issue
+    rest_fields, names = _issue_projection(fields)
+    issue = None if expand or not is_default_site() else mirror.get_issue(issue_key, rest_fields)
+    if issue is not None:
+        return {**issue_to_dict(issue.raw, names, compact), "freshness": describe_sync(issue.synced_at)}
+    issue = jira.issue(issue_key, fields=rest_fields, expand=expand)
+    return issue_to_dict(issue.raw, names, compact)
 
 @mcp.tool(title="Create issue", description="Create a new issue with flexible fields dict. Must include at minimum: project, summary, description, issuetype. Examples: {'project': {'key': 'PROJ'}, 'summary': 'Task title', 'description': 'Task description', 'issuetype': {'name': 'Story'}, 'parent': {'key': 'EPIC-123'}} for creating story in epic, or {'project': {'key': 'PROJ'}, 'summary': 'Bug title', 'description': 'Bug description', 'issuetype': {'name': 'Bug'}, 'priority': {'name': 'High'}, 'components': [{'name': 'Frontend'}]} for bug with priority and component")
 def create_issue(fields: dict) -> dict:
     """Create a new issue with custom fields dict. Must include at minimum: project, summary, description, issuetype"""
     new_issue = jira.create_issue(fields=fields)
+    _mark_written(new_issue.key)
     return {"key": new_issue.key, "id": new_issue.id, "summary": new_issue.fields.summary}
 
 @mcp.tool(title="Create simple issue", description="Create a basic issue with common fields. Parameters: project_key (e.g. 'PROJ'), summary (title), description (detailed description), issue_type (Task, Story, Bug, Epic, etc.). Example: project_key='MYPROJ', summary='Fix login bug', description='User cannot login with special characters', issue_type='Bug'")
@@ -100,19 +173,26 @@ def create_simple_issue(project_key: str, summary: str, description: str, issue_
         'issuetype': {'name': issue_type}
     }
     new_issue = jira.create_issue(fields=issue_dict)
+    _mark_written(new_issue.key)
     return {"key": new_issue.key, "id": new_issue.id, "summary": new_issue.fields.summary}
 
 @mcp.tool(title="Update issue", description="Update issue with flexible fields dict. Can update any field like assignee, priority, components, etc. Example fields: {'assignee': {'name': 'john.doe'}, 'priority': {'name': 'High'}, 'components': [{'name': 'Frontend'}], 'customfield_10000': 'Epic Name', 'labels': ['urgent', 'bug']}")
 def update_issue(issue_key: str, fields: dict, notify_users: bool = True) -> dict:
     """Update issue with custom fields"""
-    issue = jira.issue(issue_key)
-    issue.update(fields=fields, notify=notify_users)
+    _put_fields(issue_key, fields, notify_users)
+    _mark_written(issue_key)
     return {"success": True, "message": f"Issue {issue_key} updated"}
 
+def _put_fields(issue_key: str, fields: dict, notify_users: bool = True) -> None:
+    """Update issue fields with one PUT; Issue.update would also reload the issue with a GET afterwards"""
+    params = None if notify_users else {"notifyUsers": "false"}
+    jira._session.put(jira._get_url(f"issue/{issue_key}"), data=json.dumps({"fields": fields}), params=params)
+
 @mcp.tool(title="Assign issue", description="Assign issue to a user")
 def assign_issue(issue_key: str, assignee: str) -> dict:
     """Assign issue to user"""
     jira.assign_issue(issue_key, assignee)
+    _mark_written(issue_key)
     return {"success": True, "message": f"Issue {issue_key} assigned to {assignee}"}
 
 @mcp.tool(title="Get issue transitions", description="Get available workflow transitions for an issue. Returns transition IDs and names that can be used with transition_issue(). Common transitions: To Do -> In Progress, In Progress -> Done, Open -> Resolved", annotations={"readOnlyHint": True})
@@ -125,53 +205,148 @@ def get_issue_transitions(issue_key: str) -> list[dict]:
 def transition_issue(issue_key: str, transition_id: str, fields: dict = None) -> dict:
     """Transition issue to new status with optional fields (e.g., resolution, assignee, etc.)"""
     jira.transition_issue(issue_key, transition_id, fields=fields or {})
+    _mark_written(issue_key)
     return {"success": True, "message": f"Issue {issue_key} transitioned"}
 
 # Comments
-@mcp.tool(title="Get issue comments", description="Get all comments for an issue including comment ID, body text, author information, creation date, and visibility restrictions. Use for reviewing issue discussion history", annotations={"readOnlyHint": True})
-def get_issue_comments(issue_key: str) -> list[dict]:
+@mcp.tool(title="Get issue comments", description="Get all comments for an issue: id, author, body, created/updated dates and visibility restrictions. Use for reviewing issue discussion history. format 'columns' returns {columns, rows} instead of {items}, which is much smaller for long lists. The response is kept to about max_bytes (default JIRA_RESPONSE_MAX_BYTES, 0 for no limit); pass next_cursor as cursor to get the rest", annotations={"readOnlyHint": True})
+def get_issue_comments(issue_key: str, format: str = "objects", max_bytes: int = None, cursor: str = None) -> dict:
     """Get issue comments"""
-    comments = jira.comments(issue_key)
-    return comments
+    comments = [slim(comment, "comment") for comment in jira.comments(issue_key)]
+    return encode_list(comments, "comment", f"comments:{issue_key}", format, _budget(max_bytes), cursor)
 
 @mcp.tool(title="Add comment", description="Add comment to an issue with optional visibility. visibility example: {'type': 'group', 'value': 'jira-developers'} for group visibility or {'type': 'role', 'value': 'Developers'} for role visibility. Use is_internal=True for internal comments in Service Desk")
 def add_comment(issue_key: str, comment_body: str, visibility: dict = None, is_internal: bool = False) -> dict:
     """Add comment to issue with optional visibility settings"""
     comment = jira.add_comment(issue_key, comment_body, visibility=visibility, is_internal=is_internal)
+    _mark_written(issue_key)
     return {"id": comment.id, "body": comment.body, "created": comment.created}
 
+# Batch operations
+@mcp.tool(title="Get issues", description="Get several issues by key in a single JQL search instead of one get_issue call per key. fields, expand and compact work as in get_issue. Keys that do not exist or are not visible are listed in missing", annotations={"readOnlyHint": True})
+def get_issues(issue_keys: list[str], fields: str = None, expand: str = None, compact: bool = False) -> dict:
+    """Get issues by keys"""
+    rest_fields, names = _issue_projection(fields)
+    found = {}
+    for chunk in chunked(list(dict.fromkeys(key.upper() for key in issue_keys)), config.batch_search_size):
+        query = "key in ({})".format(", ".join(_jql_string(key) for key in chunk))
+        # Paged, since the server may return fewer issues per request than the chunk holds
+        pager = IssuePager(jira, query, fields=rest_fields, expand=expand, page_size=len(chunk), prefetch=config.search_prefetch, validate_query=False)
+        for _, issues in pager.pages(0):
+            for issue in issues:
+                found[issue.key.upper()] = issue_to_dict(issue.raw, names, compact)
+    return {
+        "issues": [found[key.upper()] for key in issue_keys if key.upper() in found],
+        "missing": [key for key in issue_keys if key.upper() not in found],
+    }
+
+def _jql_string(value: str) -> str:
+    """Quote a value as a JQL string literal"""
+    return '"{}"'.format(value.replace("\\", "\\\\").replace('"', '\\"'))
+
+@mcp.tool(title="Create issues", description="Create several issues using Jira's bulk create endpoint. issues is a list of fields dicts, each in the same format as create_issue. Returns succeeded (index, key, id) and failed (index, error) entries, where index is the position in the input list")
+def create_issues(issues: list[dict]) -> dict:
+    """Create issues in bulk"""
+    succeeded = []
+    failed = []
+    offset = 0
+    for chunk in chunked(issues, config.batch_create_size):
+        try:
+            results = jira.create_issues(field_list=chunk, prefetch=False)
+        except Exception as e:
+            # Report the chunk as failed and keep going, so issues created by other chunks are still returned
+            failed.extend({"index": index, "error": str(e)} for index in range(offset, offset + len(chunk)))
+            offset += len(chunk)
+            continue
+        for index, result in enumerate(results, start=offset):
+            if result["status"] == "Success":
+                succeeded.append({"index": index, "key": result["issue"].key, "id": result["issue"].id})
+            else:
+                failed.append({"index": index, "error": result["error"]})
+        offset += len(chunk)
+    _mark_written(*(entry["key"] for entry in succeeded))
+    return {"succeeded": succeeded, "failed": failed}
+
+@mcp.tool(title="Update issues", description="Update several issues concurrently. updates maps issue key to a fields dict in the same format as update_issue, e.g. {'PROJ-1': {'priority': {'name': 'High'}}, 'PROJ-2': {'labels': ['triaged']}}. Returns lists of succeeded and failed keys")
+def update_issues(updates: dict[str, dict], notify_users: bool = True) -> dict:
+    """Update issues in bulk"""
+    report = run_batch(updates, lambda key: _put_fields(key, updates[key], notify_users), max_workers=config.batch_concurrency)
+    _mark_written(*updates)
+    return report
+
+@mcp.tool(title="Transition issues", description="Transition several issues concurrently with the same transition_id and optional fields (see transition_issue). All issues must share a workflow where transition_id is valid. Returns lists of succeeded and failed keys")
+def transition_issues(issue_keys: list[str], transition_id: str, fields: dict = None) -> dict:
+    """Transition issues in bulk"""
+    def transition(key: str) -> None:
+        jira.transition_issue(key, transition_id, fields=fields or {})
+    report = run_batch(issue_keys, transition, max_workers=config.batch_concurrency)
+    _mark_written(*issue_keys)
+    return report
+
+@mcp.tool(title="Add comments", description="Add the same comment to several issues concurrently. visibility and is_internal work as in add_comment. Returns lists of succeeded and failed keys, and the created comment id per key")
+def add_comments(issue_keys: list[str], comment_body: str, visibility: dict = None, is_internal: bool = False) -> dict:
+    """Add comment to issues in bulk"""
+    report = run_batch(issue_keys, lambda key: jira.add_comment(key, comment_body, visibility=visibility, is_internal=is_internal).id, max_workers=config.batch_concurrency)
+    _mark_written(*issue_keys)
+    return report
+
 # Links
 @mcp.tool(title="Create issue link", description="Create link between issues. link_data must contain type, inwardIssue, outwardIssue. Example: {'type': {'name': 'Blocks'}, 'inwardIssue': {'key': 'PROJ-1'}, 'outwardIssue': {'key': 'PROJ-2'}} means PROJ-1 blocks PROJ-2. Common link types: Blocks, Duplicate, Relates, Causes, Cloners")
 def create_issue_link(link_data: dict) -> dict:
     """Create issue link with custom data dict. Example: {'type': {'name': 'Duplicate'}, 'inwardIssue': {'key': 'PROJ-1'}, 'outwardIssue': {'key': 'PROJ-2'}}"""
     result = jira.create_issue_link(link_data)
+    _mark_written(*((link_data.get(side) or {}).get("key") for side in ("inwardIssue", "outwardIssue")))
     return {"success": True, "message": "Issue link created"}
 
 # Attachments
-@mcp.tool(title="Add attachment", description="Add attachment to an issue")
-def add_attachment(issue_key: str, file_path: str) -> dict:
+@mcp.tool(title="Add attachment", description="Add attachment to an issue. The file is streamed from disk, so large files are not loaded into memory; upload progress is reported while it runs. Files above JIRA_ATTACHMENT_MAX_BYTES are rejected", timeout=config.attachment_timeout)
+def add_attachment(issue_key: str, file_path: str, filename: str = None, ctx: Context = None) -> dict:
     """Add attachment to issue"""
-    attachment = jira.add_attachment(issue_key, file_path)
-    return {"id": attachment.id, "filename": attachment.filename, "size": attachment.size}
+    size = attachments.check_size(file_path)
+    progress = attachments.ProgressThrottle(lambda done, total: report_progress(ctx, done, total), size, config.attachment_chunk_size)
+    result = attachments.upload(jira, issue_key, file_path, filename=filename, progress=progress)
+    _mark_written(issue_key)
+    return result
+
+@mcp.tool(title="Add attachments", description="Upload several files to one issue in parallel, streaming each from disk. Progress is reported as total bytes sent across all files. Returns lists of succeeded and failed paths, and the created attachment per path", timeout=config.attachment_timeout)
+def add_attachments(issue_key: str, file_paths: list[str], ctx: Context = None) -> dict:
+    """Add attachments to issue in parallel"""
+    sizes = {}
+    failed = []
+    for path in dict.fromkeys(file_paths):
+        try:
+            sizes[path] = attachments.check_size(path)
+        except (OSError, ValueError) as e:
+            failed.append({"key": path, "error": str(e)})
+    progress = attachments.ProgressThrottle(lambda done, total: report_progress(ctx, done, total), sum(sizes.values()), config.attachment_chunk_size)
+    report = run_batch(sizes, lambda path: attachments.upload(jira, issue_key, path, progress=progress), max_workers=config.attachment_concurrency)
+    report["failed"] = failed + report["failed"]
+    _mark_written(issue_key)
+    return report
+
+@mcp.tool(title="Get attachment", description="Download an attachment by id. With output_path the content is streamed to that local file in chunks and only metadata is returned. Without it, up to JIRA_ATTACHMENT_INLINE_MAX_BYTES starting at offset are returned inline, as text for text types and base64 otherwise; use offset and length to read large attachments piece by piece (truncated tells whether more remains)", timeout=config.attachment_timeout)
+def get_attachment(attachment_id: str, output_path: str = None, offset: int = 0, length: int = None, ctx: Context = None) -> dict:
+    """Download attachment to a file or return a byte range of it"""
+    return attachments.download(jira, attachment_id, output_path=output_path, offset=offset, length=length, progress=lambda done, total: report_progress(ctx, done, total))
 
 # Users
-@mcp.tool(title="Get user", description="Get user information by account ID or username. Returns display name, email, active status, account type. Use account ID for Jira Cloud, username for Server/Data Center", annotations={"readOnlyHint": True})
+@mcp.tool(title="Get user", description="Get user information by account ID or username. Returns accountId, name, displayName, email, active, timeZone and accountType, omitting values Jira does not provide. Use account ID for Jira Cloud, username for Server/Data Center", annotations={"readOnlyHint": True})
 def get_user(account_id: str) -> dict:
     """Get user by account ID"""
-    user = jira.user(account_id)
-    return user
+    return slim(jira.user(account_id), "user")
 
-@mcp.tool(title="Search users", description="Search for users", annotations={"readOnlyHint": True})
-def search_users(query: str, max_results: int = 50) -> list[dict]:
+@mcp.tool(title="Search users", description="Search for users by name or email; returns accountId, name, displayName, email, active, timeZone and accountType. format 'columns' returns {columns, rows} instead of {items}, which is much smaller for long lists. The response is kept to about max_bytes (default JIRA_RESPONSE_MAX_BYTES, 0 for no limit); pass next_cursor as cursor to get the rest", annotations={"readOnlyHint": True})
+def search_users(query: str, max_results: int = 50, format: str = "objects", max_bytes: int = None, cursor: str = None) -> dict:
     """Search for users"""
-    users = jira.search_users(query=query, maxResults=max_results)
-    return users
+    users = [slim(user, "user") for user in jira.search_users(query=query, maxResults=max_results)]
+    return encode_list(users, "user", f"users:{query}:{max_results}", format, _budget(max_bytes), cursor)
 
 # Groups
-@mcp.tool(title="Get groups", description="Get list of groups", annotations={"readOnlyHint": True})
-def get_groups(query: str = None) -> list[str]:
+@mcp.tool(title="Get groups", description="Get list of group names, optionally filtered by query. format 'columns' returns {columns, rows} instead of {items}, which is much smaller for long lists. The response is kept to about max_bytes (default JIRA_RESPONSE_MAX_BYTES, 0 for no limit); pass next_cursor as cursor to get the rest", annotations={"readOnlyHint": True})
+def get_groups(query: str = None, format: str = "objects", max_bytes: int = None, cursor: str = None) -> dict:
     """Get groups"""
-    return jira.groups(query=query)
+    groups = [{"name": name} for name in jira.groups(query=query)]
+    return encode_list(groups, "group", f"groups:{query or ''}", format, _budget(max_bytes), cursor)
 
 @mcp.tool(title="Add user to group", description="Add user to a group")
 def add_user_to_group(username: str, group_name: str) -> dict:
@@ -196,6 +371,7 @@ def create_component(name: str, project_key: str, description: str = "", lead_us
         params.update(additional_params)
     
     component = jira.create_component(**params)
+    metadata_cache.invalidate("project_components", project_key)
     return {"id": component.id, "name": component.name, "description": getattr(component, 'description', '')}
 
 # Versions
@@ -217,6 +393,7 @@ def create_version(name: str, project_key: str, description: str = "", release_d
         params.update(additional_params)
     
     version = jira.create_version(**params)
+    metadata_cache.invalidate("project_versions", project_key)
     return {"id": version.id, "name": version.name, "description": getattr(version, 'description', '')}
 
 # Filters
@@ -232,35 +409,83 @@ def get_favorite_filters() -> list[dict]:
     } for f in filters]
 
 # Fields and types
-@mcp.tool(title="Get fields", description="Get all available issue fields including system fields (summary, description, assignee) and custom fields (customfield_10000, etc.). Use this to discover field IDs for create_issue and update_issue operations", annotations={"readOnlyHint": True})
-def get_fields() -> list[dict]:
-    """Get all fields"""
+@metadata_cache.cached("fields")
+def _fields_meta() -> list[dict]:
+    """Full field metadata as returned by Jira"""
     return jira.fields()
 
+@mcp.tool(title="Get fields", description="Get all available issue fields including system fields (summary, description, assignee) and custom fields (customfield_10000, etc.) with id, name, custom flag and value type. Use this to discover field IDs for create_issue and update_issue operations. query filters by id or name substring. format 'columns' returns {columns, rows} instead of {items}, which is much smaller for long lists. The response is kept to about max_bytes (default JIRA_RESPONSE_MAX_BYTES, 0 for no limit); pass next_cursor as cursor to get the rest", annotations={"readOnlyHint": True})
+def get_fields(query: str = None, format: str = "objects", max_bytes: int = None, cursor: str = None) -> dict:
+    """Get all fields"""
+    fields = [slim(field, "field") for field in _fields_meta()]
+    if query:
+        needle = query.lower()
+        fields = [field for field in fields if needle in field["id"].lower() or needle in field.get("name", "").lower()]
+    return encode_list(fields, "field", f"fields:{query or ''}", format, _budget(max_bytes), cursor)
+
 @mcp.tool(title="Get issue types", description="Get all issue types", annotations={"readOnlyHint": True})
+@metadata_cache.cached("issue_types")
 def get_issue_types() -> list[dict]:
     """Get issue types"""
     issue_types = jira.issue_types()
     return [{"id": it.id, "name": it.name, "description": getattr(it, 'description', '')} for it in issue_types]
 
 @mcp.tool(title="Get priorities", description="Get all priorities", annotations={"readOnlyHint": True})
+@metadata_cache.cached("priorities")
 def get_priorities() -> list[dict]:
     """Get priorities"""
     priorities = jira.priorities()
     return [{"id": p.id, "name": p.name, "description": getattr(p, 'description', '')} for p in priorities]
 
 @mcp.tool(title="Get statuses", description="Get all statuses", annotations={"readOnlyHint": True})
+@metadata_cache.cached("statuses")
 def get_statuses() -> list[dict]:
     """Get statuses"""
     statuses = jira.statuses()
     return [{"id": s.id, "name": s.name, "description": getattr(s, 'description', '')} for s in statuses]
 
 @mcp.tool(title="Get resolutions", description="Get all resolutions", annotations={"readOnlyHint": True})
+@metadata_cache.cached("resolutions")
 def get_resolutions() -> list[dict]:
     """Get resolutions"""
     resolutions = jira.resolutions()
     return [{"id": r.id, "name": r.name, "description": getattr(r, 'description', '')} for r in resolutions]
 
+# Metadata cache
+@mcp.tool(title="Get cache stats", description="Get hit/miss counters and size of the site's metadata cache used by get_fields, get_issue_types, get_priorities, get_statuses, get_resolutions, get_projects, get_project_components and get_project_versions", annotations={"readOnlyHint": True})
+def get_cache_stats() -> dict:
+    """Get metadata cache statistics"""
+    return metadata_cache.stats()
+
+@mcp.tool(title="Clear cache", description="Clear the metadata cache. resource limits clearing to one resource: 'fields', 'issue_types', 'priorities', 'statuses', 'resolutions', 'projects', 'project_components', 'project_versions'. Use after changing Jira configuration outside this server")
+def clear_cache(resource: str = None) -> dict:
+    """Clear metadata cache"""
+    removed = metadata_cache.invalidate(resource) if resource else metadata_cache.clear()
+    return {"success": True, "removed": removed}
+
+# Instrumentation
+@mcp.tool(title="Server metrics", description="Get per-tool statistics collected since server start: call and error counts, error rate, latency mean/p50/p95/p99 in seconds, response bytes, and the number, duration and status classes of upstream Jira HTTP requests each tool made. Also reports the metadata cache counters and the current client-side rate limit with throttled responses and retries of the site it is called for, and how many upstream executions of read-only tools were saved by coalescing identical concurrent calls. format='openmetrics' returns the same data as Prometheus/OpenMetrics text", annotations={"readOnlyHint": True})
+def server_metrics(format: str = "json") -> dict:
+    """Get server metrics"""
+    if format == "openmetrics":
+        return {"format": "openmetrics", "text": metrics.openmetrics()}
+    return {"format": "json", "site": site_name(), "tools": metrics.summary(), "cache": metadata_cache.stats(), "rate_limit": scheduler.stats(), "coalescing": single_flight.stats()}
+
+# Local issue mirror
+@mcp.tool(title="Sync mirror", description="Synchronize the local issue mirror of the projects in JIRA_MIRROR_PROJECTS (on the default site) now. Loads issues updated since the last sync; full=True reloads every issue and drops issues deleted or moved out of the project. While the mirror is fresh, search_issues, search_all_issues and get_issue answer simple JQL (project, key, status, assignee, labels, created/updated ranges, ORDER BY created/updated/key) from it")
+def sync_mirror(full: bool = False) -> dict:
+    """Sync local issue mirror"""
+    if not mirror.enabled:
+        raise ValueError("Issue mirror is disabled; set JIRA_MIRROR_PROJECTS to enable it")
+    if not is_default_site():
+        raise ValueError(f"The issue mirror holds issues of the default site {config.default_site!r} only")
+    return {"projects": mirror.sync(jira, full=full)}
+
+@mcp.tool(title="Mirror status", description="Get the local issue mirror state: mirrored projects, issue counts, issues marked stale by writes through this server, last sync time, age and update watermark, and the last background sync error", annotations={"readOnlyHint": True})
+def get_mirror_status() -> dict:
+    """Get local issue mirror status"""
+    return mirror.status()
+
 # Agile / Jira Software
 @mcp.tool(title="Get boards", description="Get agile boards", annotations={"readOnlyHint": True})
 def get_boards(start_at: int = 0, max_results: int = 50) -> list[dict]:
@@ -286,6 +511,42 @@ def get_sprints(board_id: int, state: str = None) -> list[dict]:
         "endDate": getattr(sprint, 'endDate', '')
     } for sprint in sprints]
 
+@metadata_cache.cached("board_configuration")
+def _board_configuration(board_id: int) -> dict:
+    """Board configuration, including the field the board estimates with"""
+    return jira._get_json(f"board/{board_id}/configuration", base=jira.AGILE_BASE_URL)
+
+@mcp.tool(title="Get sprint snapshot", description="Get a sprint and all of its issues in one call, with aggregates computed server side: issue count, estimate (the board's estimation field, e.g. story points) and remaining hours by status and by assignee, completed estimate, hours spent and unestimated issues. Pass sprint_id, or state ('active', 'future' or 'closed') to pick the board's current, next or most recent closed sprint. include_issues=False returns only the aggregates", annotations={"readOnlyHint": True})
+def get_sprint_snapshot(board_id: int, sprint_id: int = None, state: str = "active", include_issues: bool = True) -> dict:
+    """Get sprint metadata, issues and estimate aggregates"""
+    configuration = submit(_board_configuration, board_id)
+    other_sprints = []
+    if sprint_id is None:
+        sprints = [sprint.raw for sprint in jira.sprints(board_id, state=state, maxResults=False)]
+        if not sprints:
+            raise ValueError(f"Board {board_id} has no {state} sprint")
+        sprint = sprints[-1] if state == "closed" else sprints[0]
+        other_sprints = [{"id": s["id"], "name": s.get("name")} for s in sprints if s is not sprint]
+    else:
+        sprint = jira.sprint(sprint_id).raw
+
+    estimate = estimation_field(configuration.result())
+    fields = SNAPSHOT_FIELDS + ([estimate["id"]] if estimate else [])
+    pager = SprintIssuePager(jira, sprint["id"], ",".join(fields), page_size=config.search_page_size, prefetch=config.search_prefetch)
+    issues = [issue for _, page in pager.pages() for issue in page]
+
+    snapshot = {
+        "board_id": board_id,
+        "sprint": {name: sprint.get(name) for name in ("id", "name", "state", "goal", "startDate", "endDate", "completeDate") if sprint.get(name)},
+        "estimation": estimate or {"type": "issueCount"},
+    }
+    if other_sprints:
+        snapshot["other_sprints"] = other_sprints
+    snapshot.update(summarize_sprint(issues, estimate and estimate["id"]))
+    if not include_issues:
+        del snapshot["issues"]
+    return snapshot
+
 @mcp.tool(title="Create sprint", description="Create a new sprint")
 def create_sprint(name: str, board_id: int, start_date: str = None, end_date: str = None) -> dict:
     """Create sprint"""
@@ -296,6 +557,7 @@ def create_sprint(name: str, board_id: int, start_date: str = None, end_date: st
 def add_issues_to_sprint(sprint_id: int, issue_keys: list[str]) -> dict:
     """Add issues to sprint"""
     jira.add_issues_to_sprint(sprint_id, issue_keys)
+    _mark_written(*issue_keys)
     return {"success": True, "message": f"Added {len(issue_keys)} issues to sprint {sprint_id}"}
 
 # Voting and watching
@@ -312,6 +574,7 @@ def get_watchers(issue_key: str) -> dict:
 def add_watcher(issue_key: str, username: str) -> dict:
     """Add watcher to issue"""
     jira.add_watcher(issue_key, username)
+    _mark_written(issue_key)
     return {"success": True, "message": f"Added {username} as watcher to {issue_key}"}
 
 # Worklogs
@@ -327,6 +590,61 @@ def get_worklogs(issue_key: str) -> list[dict]:
         "started": worklog.started
     } for worklog in worklogs]
 
+@mcp.tool(title="Collect worklogs", description="Total the hours logged between since and until (YYYY-MM-DD, both inclusive; until defaults to today) on all issues matching jql, aggregated per user, per issue, per day and per user and day. Worklogs that come with the search results are used directly; the rest are fetched with the bulk worklog API or per issue (method 'auto', 'bulk' or 'per_issue'). include_entries=True also lists every worklog. Example: collect_worklogs(jql='project = PROJ', since='2024-05-01', until='2024-05-31')", annotations={"readOnlyHint": True})
+def collect_worklogs(jql: str, since: str, until: str = None, method: str = "auto", include_entries: bool = False, ctx: Context = None) -> dict:
+    """Aggregate worklog hours for the issues of a JQL query"""
+    if method not in ("auto", "bulk", "per_issue"):
+        raise ValueError("method must be 'auto', 'bulk' or 'per_issue'")
+    since_day = parse_day(since)
+    until_day = parse_day(until) if until else date.today()
+    # Let Jira drop issues without work logged in the window; ORDER BY cannot be parenthesized
+    base_query = re.split(r"\border\s+by\b", jql, maxsplit=1, flags=re.IGNORECASE)[0].strip()
+    query = f'worklogDate >= "{since_day}" AND worklogDate <= "{until_day}"'
+    if base_query:
+        query = f"({base_query}) AND {query}"
+
+    issue_keys = {}
+    incomplete = []
+    report = WorklogReport(since_day, until_day, issue_keys, include_entries=include_entries)
+    pager = IssuePager(jira, query, fields="worklog", page_size=config.search_page_size, prefetch=config.search_prefetch)
+    for offset, issues in pager.pages():
+        for issue in issues:
+            issue_keys[str(issue.id)] = issue.key
+            embedded = issue.raw.get("fields", {}).get("worklog") or {}
+            for worklog in embedded.get("worklogs", []):
+                report.add(issue.key, worklog)
+            # Search results carry at most the first 20 worklogs of an issue
+            if embedded.get("total", 0) > len(embedded.get("worklogs", [])):
+                incomplete.append(issue.key)
+        report_progress(ctx, offset + len(issues), pager.total)
+
+    used = "search" if not incomplete else method
+    if used == "auto":
+        used = "bulk" if len(incomplete) > config.worklog_bulk_threshold else "per_issue"
+    failed = []
+    scanned = None
+    if used == "bulk":
+        from jira.exceptions import JIRAError
+        try:
+            scanned = collect_bulk(jira, report, since_day)
+        except JIRAError:
+            if method == "bulk":
+                raise
+            used = "per_issue"
+    if used == "per_issue":
+        def fetch(key):
+            for worklog in fetch_issue_worklogs(jira, key, since_day, until_day):
+                report.add(key, worklog)
+        failed = run_batch(incomplete, fetch, max_workers=config.batch_concurrency)["failed"]
+
+    result = {"jql": jql, "issues": len(issue_keys), "method": used, "fetched_issues": len(incomplete)}
+    if scanned is not None:
+        result["bulk_worklogs_scanned"] = scanned
+    result.update(report.result())
+    if failed:
+        result["failed"] = failed
+    return result
+
 @mcp.tool(title="Add worklog", description="Add worklog to an issue. time_spent format: '1h 30m', '2d', '45m'. time_spent_seconds as alternative (3600 for 1 hour). started format: '2023-12-01T10:00:00.000+0000'. user is username for worklog author. visibility example: {'type': 'group', 'value': 'jira-developers'}")
 def add_worklog(issue_key: str, time_spent: str = None, time_spent_seconds: str = None, comment: str = "", started: str = None, user: str = None, visibility: dict = None, additional_params: dict = None) -> dict:
     """Add worklog to issue with flexible parameters"""
@@ -347,6 +665,7 @@ def add_worklog(issue_key: str, time_spent: str = None, time_spent_seconds: str
         params.update(additional_params)
     
     worklog = jira.add_worklog(issue_key, **params)
+    _mark_written(issue_key)
     return {"id": worklog.id, "timeSpent": worklog.timeSpent, "comment": getattr(worklog, 'comment', '')}
 
 # Service Desk (if supported)
@@ -358,10 +677,23 @@ def check_service_desk_support() -> dict:
 @mcp.tool(title="Get service desks", description="Get service desks", annotations={"readOnlyHint": True})
 def get_service_desks() -> list[dict]:
     """Get service desks"""
+    from jira.exceptions import JIRAError
     try:
         service_desks = jira.service_desks()
-        return [{"id": sd.id, "projectKey": sd.projectKey, "projectName": sd.projectName} for sd in service_desks]
-    except:
-        return []
-
-
+    except JIRAError as e:
+        # Service Desk not installed or not licensed for this user; throttling and other errors still surface
+        if e.status_code in (403, 404):
+            return []
+        raise
+    return [{"id": sd.id, "projectKey": sd.projectKey, "projectName": sd.projectName} for sd in service_desks]
+
+def _warm_up() -> None:
+    """Create a worker client and load field metadata before the first tool call needs them"""
+    jira.get()
+    _fields_meta()
+
+if config.warmup:
+    tool_executor.submit(_warm_up)
+
+if mirror.enabled:
+    mirror.start_background_sync(jira, config.mirror_sync_interval)
@@ -0,0 +1,151 @@
+import contextvars
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+
+# Name of the tool being executed; propagated into worker threads with the context
+current_tool: contextvars.ContextVar[str] = contextvars.ContextVar("current_tool", default="")
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+
+class Histogram:
+    """Fixed-bucket histogram in the Prometheus style"""
+
+    def __init__(self, buckets: tuple):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile by linear interpolation inside the bucket that contains it"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if seen + bucket_count >= rank and bucket_count:
+                lower = self.buckets[index - 1] if index else 0.0
+                upper = self.buckets[index] if index < len(self.buckets) else self.buckets[-1]
+                return lower + (upper - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return self.buckets[-1]
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        """(le, cumulative count) pairs including +Inf"""
+        result = []
+        total = 0
+        for bound, bucket_count in zip(self.buckets + ("+Inf",), self.counts):
+            total += bucket_count
+            result.append((str(bound), total))
+        return result
+
+
+class ToolStats:
+    """Counters for one tool"""
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.response_bytes = Histogram(SIZE_BUCKETS)
+        self.upstream_latency = Histogram(LATENCY_BUCKETS)
+        self.upstream_status = defaultdict(int)
+
+
+class Metrics:
+    """Per-tool latency, response size and upstream HTTP call statistics"""
+
+    def __init__(self):
+        self._tools: dict[str, ToolStats] = defaultdict(ToolStats)
+        self._lock = threading.Lock()
+
+    def record_call(self, tool: str, seconds: float, response_bytes: int = 0, error: bool = False) -> None:
+        """Record one finished tool call"""
+        with self._lock:
+            stats = self._tools[tool]
+            stats.calls += 1
+            stats.latency.observe(seconds)
+            if error:
+                stats.errors += 1
+            else:
+                stats.response_bytes.observe(response_bytes)
+
+    def record_upstream(self, response, *args, **kwargs) -> None:
+        """Called by ThrottledAdapter for every HTTP attempt: attribute it to the tool running in this context"""
+        tool = current_tool.get() or "_background"
+        with self._lock:
+            stats = self._tools[tool]
+            stats.upstream_latency.observe(response.elapsed.total_seconds())
+            stats.upstream_status[f"{response.status_code // 100}xx"] += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._tools.clear()
+
+    def summary(self) -> dict:
+        """Per-tool statistics with estimated latency percentiles"""
+        with self._lock:
+            result = {}
+            for tool, stats in sorted(self._tools.items()):
+                upstream_calls = stats.upstream_latency.count
+                result[tool] = {
+                    "calls": stats.calls,
+                    "errors": stats.errors,
+                    "error_rate": round(stats.errors / stats.calls, 4) if stats.calls else 0.0,
+                    "latency_s": {
+                        "mean": round(stats.latency.sum / stats.calls, 4) if stats.calls else 0.0,
+                        "p50": round(stats.latency.quantile(0.5), 4),
+                        "p95": round(stats.latency.quantile(0.95), 4),
+                        "p99": round(stats.latency.quantile(0.99), 4),
+                    },
+                    "response_bytes": {
+                        "total": int(stats.response_bytes.sum),
+                        "mean": int(stats.response_bytes.sum / stats.response_bytes.count) if stats.response_bytes.count else 0,
+                    },
+                    "upstream": {
+                        "calls": upstream_calls,
+                        "calls_per_tool_call": round(upstream_calls / stats.calls, 2) if stats.calls else None,
+                        "total_s": round(stats.upstream_latency.sum, 4),
+                        "status": dict(stats.upstream_status),
+                    },
+                }
+            return result
+
+    def openmetrics(self, prefix: str = "jira_mcp") -> str:
+        """Render all statistics in the Prometheus/OpenMetrics text format"""
+        lines = []
+        with self._lock:
+            tools = sorted(self._tools.items())
+            lines.append(f"# TYPE {prefix}_tool_calls counter")
+            for tool, stats in tools:
+                lines.append(f'{prefix}_tool_calls_total{{tool="{tool}"}} {stats.calls}')
+            lines.append(f"# TYPE {prefix}_tool_errors counter")
+            for tool, stats in tools:
+                lines.append(f'{prefix}_tool_errors_total{{tool="{tool}"}} {stats.errors}')
+            for name, attr, unit in (("tool_latency_seconds", "latency", "seconds"), ("tool_response_bytes", "response_bytes", "bytes"), ("upstream_latency_seconds", "upstream_latency", "seconds")):
+                lines.append(f"# TYPE {prefix}_{name} histogram")
+                lines.append(f"# UNIT {prefix}_{name} {unit}")
+                for tool, stats in tools:
+                    histogram = getattr(stats, attr)
+                    for le, count in histogram.cumulative():
+                        lines.append(f'{prefix}_{name}_bucket{{tool="{tool}",le="{le}"}} {count}')
+                    lines.append(f'{prefix}_{name}_sum{{tool="{tool}"}} {histogram.sum}')
+                    lines.append(f'{prefix}_{name}_count{{tool="{tool}"}} {histogram.count}')
+            lines.append(f"# TYPE {prefix}_upstream_requests counter")
+            for tool, stats in tools:
+                for status, count in sorted(stats.upstream_status.items()):
+                    lines.append(f'{prefix}_upstream_requests_total{{tool="{tool}",status="{status}"}} {count}')
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+# Global metrics instance
+metrics = Metrics()
@@ -0,0 +1,578 @@
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Optional
+from zoneinfo import ZoneInfo
+
+from config import config
+from pagination import IssuePager
+
+logger = logging.getLogger(__name__)
+
+# Fields the mirror needs for filtering, always requested in addition to JIRA_MIRROR_FIELDS
+REQUIRED_FIELDS = ("summary", "project", "status", "assignee", "labels", "created", "updated")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    key TEXT PRIMARY KEY,
+    project TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    status TEXT,
+    assignee_id TEXT,
+    assignee_name TEXT,
+    created TEXT,
+    updated TEXT,
+    fetched_at REAL NOT NULL,
+    raw TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS issues_project_updated ON issues (project, updated);
+CREATE TABLE IF NOT EXISTS issue_labels (
+    key TEXT NOT NULL,
+    label TEXT NOT NULL,
+    PRIMARY KEY (key, label)
+);
+CREATE INDEX IF NOT EXISTS issue_labels_label ON issue_labels (label);
+CREATE TABLE IF NOT EXISTS sync_state (
+    project TEXT PRIMARY KEY,
+    watermark TEXT,
+    synced_at REAL
+);
+CREATE TABLE IF NOT EXISTS stale_issues (
+    key TEXT PRIMARY KEY,
+    project TEXT NOT NULL,
+    marked_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+_TOKEN = re.compile(r"""\s*(?:(?P<str>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')|(?P<op>!=|>=|<=|=|>|<)|(?P<punct>[(),])|(?P<word>[^\s(),=!<>"']+))""")
+_RELATIVE = re.compile(r"^([-+]?\d+)([mhdw])$")
+_UNITS = {"m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+_DATE_FORMATS = ("%Y-%m-%d %H:%M", "%Y/%m/%d %H:%M", "%Y-%m-%d", "%Y/%m/%d")
+_COLUMNS = {"status": "status", "key": "issues.key", "project": "issues.project"}
+
+
+class UnsupportedQuery(ValueError):
+    """JQL outside the subset the mirror can answer"""
+
+
+def _tokenize(query: str) -> list[tuple[str, str]]:
+    tokens = []
+    position = 0
+    query = query.strip()
+    while position < len(query):
+        match = _TOKEN.match(query, position)
+        if not match or match.end() == position:
+            raise UnsupportedQuery(query)
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == "str":
+            value = re.sub(r"\\(.)", r"\1", value[1:-1])
+        tokens.append((kind, value))
+        position = match.end()
+    return tokens
+
+
+def describe_sync(synced_at: Optional[float]) -> dict:
+    """Freshness metadata attached to answers served from the mirror"""
+    return {
+        "source": "mirror",
+        "synced_at": datetime.fromtimestamp(synced_at, timezone.utc).isoformat(timespec="seconds") if synced_at else None,
+        "age_s": round(time.time() - synced_at, 1) if synced_at else None,
+    }
+
+
+def _to_utc(value: str) -> str:
+    """Convert a Jira timestamp like 2024-01-15T10:20:30.000+0100 to a sortable UTC string"""
+    parsed = datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f%z")
+    return parsed.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+
+@lru_cache(maxsize=256)
+def parse_jql(query: str) -> tuple:
+    """Parse the supported JQL subset into (clauses, order_by).
+
+    Supported: clauses joined by AND on project, key, status, assignee and labels with =, !=, IN,
+    NOT IN, IS [NOT] EMPTY; created/updated compared with >=, <=, >, < to absolute dates or
+    relative offsets like -7d; ORDER BY created, updated or key"""
+    tokens = _tokenize(query)
+    position = 0
+
+    def peek(offset: int = 0) -> Optional[tuple[str, str]]:
+        return tokens[position + offset] if position + offset < len(tokens) else None
+
+    def take() -> tuple[str, str]:
+        nonlocal position
+        if position >= len(tokens):
+            raise UnsupportedQuery(query)
+        token = tokens[position]
+        position += 1
+        return token
+
+    def value() -> tuple[str, str]:
+        kind, text = take()
+        if kind not in ("str", "word"):
+            raise UnsupportedQuery(query)
+        if kind == "word" and peek() == ("punct", "("):
+            take()
+            if take() != ("punct", ")"):
+                raise UnsupportedQuery(query)
+            return "function", text.lower()
+        return "value", text
+
+    def keyword(word: str) -> bool:
+        token = peek()
+        return token is not None and token[0] == "word" and token[1].lower() == word
+
+    clauses = []
+    order_by = []
+    while position < len(tokens):
+        if keyword("order"):
+            take()
+            if not keyword("by"):
+                raise UnsupportedQuery(query)
+            take()
+            while True:
+                kind, field = take()
+                field = field.lower()
+                if kind != "word" or field not in ("created", "updated", "key"):
+                    raise UnsupportedQuery(query)
+                direction = "ASC"
+                if keyword("asc") or keyword("desc"):
+                    direction = take()[1].upper()
+                order_by.append((field, direction))
+                if peek() != ("punct", ","):
+                    break
+                take()
+            if position < len(tokens):
+                raise UnsupportedQuery(query)
+            break
+
+        kind, field = take()
+        field = field.lower()
+        if kind != "word" or field not in ("project", "key", "status", "assignee", "labels", "created", "updated"):
+            raise UnsupportedQuery(query)
+
+        if keyword("is"):
+            take()
+            negate = keyword("not")
+            if negate:
+                take()
+            if not (keyword("empty") or keyword("null")) or field not in ("assignee", "labels"):
+                raise UnsupportedQuery(query)
+            take()
+            clauses.append((field, "is not empty" if negate else "is empty", None))
+        elif keyword("in") or (keyword("not") and peek(1) is not None and peek(1)[1].lower() == "in"):
+            operator = "not in" if keyword("not") else "in"
+            position += 2 if operator == "not in" else 1
+            if take() != ("punct", "("):
+                raise UnsupportedQuery(query)
+            values = [value()]
+            while peek() == ("punct", ","):
+                take()
+                values.append(value())
+            if take() != ("punct", ")"):
+                raise UnsupportedQuery(query)
+            clauses.append((field, operator, tuple(values)))
+        else:
+            op_kind, operator = take()
+            if op_kind != "op":
+                raise UnsupportedQuery(query)
+            if field in ("created", "updated"):
+                if operator not in (">=", "<=", ">", "<"):
+                    raise UnsupportedQuery(query)
+            elif operator not in ("=", "!="):
+                raise UnsupportedQuery(query)
+            clauses.append((field, operator, value()))
+
+        if position < len(tokens) and not keyword("order"):
+            if not keyword("and"):
+                raise UnsupportedQuery(query)
+            take()
+    return tuple(clauses), tuple(order_by)
+
+
+class MirrorIssue:
+    """Minimal stand-in for jira.resources.Issue built from mirrored raw JSON"""
+
+    def __init__(self, raw: dict, synced_at: Optional[float]):
+        self.raw = raw
+        self.key = raw["key"]
+        self.id = raw.get("id")
+        self.fields = SimpleNamespace(summary=(raw.get("fields") or {}).get("summary"))
+        self.synced_at = synced_at
+
+
+class ResultList(list):
+    """List of issues with the total count, like jira.client.ResultList"""
+
+    def __init__(self, items, total: int, start_at: int, max_results: int):
+        super().__init__(items)
+        self.total = total
+        self.startAt = start_at
+        self.maxResults = max_results
+
+
+class IssueMirror:
+    """SQLite copy of the issues of configured projects, kept current with updated-since JQL.
+
+    It answers a subset of JQL locally (see parse_jql). Issues written through this server are
+    marked stale and not served, nor are searches over their projects, until a later sync reloads
+    them. Issues deleted in Jira or moved to another project are only dropped by a full sync"""
+
+    def __init__(self, path: str, projects: list[str], fields: str = "*navigable", max_staleness: float = 900):
+        self.path = path
+        self.projects = [project.strip().upper() for project in projects if project.strip()]
+        requested = [field.strip() for field in fields.split(",") if field.strip()]
+        self.fields = ",".join(dict.fromkeys(requested + list(REQUIRED_FIELDS)))
+        self.max_staleness = max_staleness
+        self.last_error: Optional[dict] = None
+        self._lock = threading.RLock()
+        self._sync_lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.projects)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the database on first use (caller holds the lock)"""
+        if self._db is None:
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.executescript(SCHEMA)
+        return self._db
+
+    def _meta(self, name: str, default=None):
+        row = self._connection().execute("SELECT value FROM meta WHERE name = ?", (name,)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def _set_meta(self, name: str, value) -> None:
+        self._connection().execute("INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)", (name, json.dumps(value)))
+
+    def _timezone(self):
+        with self._lock:
+            name = self._meta("timezone", "UTC")
+        try:
+            return ZoneInfo(name)
+        except Exception:
+            return timezone.utc
+
+    # Sync
+
+    def sync(self, client, full: bool = False) -> dict:
+        """Load new and changed issues of every mirrored project; full=True reloads everything"""
+        with self._sync_lock:
+            me = client.myself()
+            with self._lock:
+                self._set_meta("timezone", me.get("timeZone") or "UTC")
+                self._set_meta("current_user", [value.lower() for value in (me.get("accountId"), me.get("name"), me.get("key")) if value])
+                self._connection().commit()
+            return {project: self._sync_project(client, project, full) for project in self.projects}
+
+    def _sync_project(self, client, project: str, full: bool) -> dict:
+        with self._lock:
+            row = self._connection().execute("SELECT watermark FROM sync_state WHERE project = ?", (project,)).fetchone()
+        watermark = None if full or row is None else row[0]
+        query = f'project = "{project}"'
+        if watermark:
+            # JQL dates have minute precision in the user's time zone; overlap by a minute and upsert
+            since = datetime.strptime(watermark, "%Y-%m-%d %H:%M:%S").replace(tzinfo=timezone.utc) - timedelta(minutes=1)
+            query += f' AND updated >= "{since.astimezone(self._timezone()):%Y/%m/%d %H:%M}"'
+        # Keys do not change when an issue is updated, so offset paging cannot skip issues
+        # the way it can when ordering by updated while issues change during the sync
+        query += " ORDER BY key ASC"
+
+        started = time.time()
+        newest = watermark
+        seen = set()
+        pager = IssuePager(client, query, fields=self.fields, page_size=config.search_page_size, prefetch=config.search_prefetch)
+        for _, issues in pager.pages(0):
+            rows = [self._row(issue.raw, started) for issue in issues]
+            seen.update(row[0] for row in rows)
+            if rows:
+                newest = max(newest or "", max(row[7] or "" for row in rows)) or None
+            self._upsert(rows)
+        # An issue updated during the sync may have been read before the update, while issues
+        # read later carry newer timestamps; the next sync has to start no later than this one
+        started_at = datetime.fromtimestamp(started, timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        newest = min(newest, started_at) if newest else None
+
+        with self._lock:
+            db = self._connection()
+            removed = 0
+            if watermark is None:
+                stale = [key for (key,) in db.execute("SELECT key FROM issues WHERE project = ?", (project,)) if key not in seen]
+                db.executemany("DELETE FROM issues WHERE key = ?", [(key,) for key in stale])
+                db.executemany("DELETE FROM issue_labels WHERE key = ?", [(key,) for key in stale])
+                removed = len(stale)
+            db.execute("INSERT OR REPLACE INTO sync_state (project, watermark, synced_at) VALUES (?, ?, ?)", (project, newest, started))
+            # Writes made before this sync started are in what it loaded
+            db.execute("DELETE FROM stale_issues WHERE project = ? AND marked_at < ?", (project, started))
+            db.commit()
+        return {"mode": "incremental" if watermark else "full", "upserted": len(seen), "removed": removed, "watermark": newest}
+
+    @staticmethod
+    def _row(raw: dict, fetched_at: float) -> tuple:
+        fields = raw.get("fields") or {}
+        assignee = fields.get("assignee") or {}
+        project, _, number = raw["key"].rpartition("-")
+        return (
+            raw["key"],
+            (fields.get("project") or {}).get("key") or project,
+            int(number) if number.isdigit() else 0,
+            (fields.get("status") or {}).get("name"),
+            assignee.get("accountId") or assignee.get("name"),
+            assignee.get("displayName"),
+            _to_utc(fields["created"]) if fields.get("created") else None,
+            _to_utc(fields["updated"]) if fields.get("updated") else None,
+            fetched_at,
+            json.dumps(raw),
+            fields.get("labels") or [],
+        )
+
+    def _upsert(self, rows: list[tuple]) -> None:
+        with self._lock:
+            db = self._connection()
+            db.executemany("INSERT OR REPLACE INTO issues VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", [row[:10] for row in rows])
+            db.executemany("DELETE FROM issue_labels WHERE key = ?", [(row[0],) for row in rows])
+            db.executemany("INSERT OR IGNORE INTO issue_labels (key, label) VALUES (?, ?)", [(row[0], label) for row in rows for label in row[10]])
+            db.commit()
+
+    def mark_stale(self, issue_keys) -> None:
+        """Stop serving issues written through this server, and searches over their projects, until a sync reloads them"""
+        rows = [(key.upper(), key.rpartition("-")[0].upper(), time.time()) for key in issue_keys if key]
+        rows = [row for row in rows if row[1] in self.projects]
+        if not rows:
+            return
+        with self._lock:
+            db = self._connection()
+            db.executemany("INSERT OR REPLACE INTO stale_issues (key, project, marked_at) VALUES (?, ?, ?)", rows)
+            db.commit()
+
+    def _has_stale(self, projects: list[str]) -> bool:
+        with self._lock:
+            placeholders = ",".join("?" * len(projects))
+            return self._connection().execute(f"SELECT 1 FROM stale_issues WHERE project IN ({placeholders}) LIMIT 1", projects).fetchone() is not None
+
+    # Reads
+
+    def freshness(self, projects: Optional[list[str]] = None) -> dict:
+        """When the given (default: all) mirrored projects were last synced"""
+        projects = projects or self.projects
+        with self._lock:
+            placeholders = ",".join("?" * len(projects))
+            synced = [row[0] for row in self._connection().execute(f"SELECT synced_at FROM sync_state WHERE project IN ({placeholders})", projects)]
+        if len(synced) < len(projects) or not all(synced):
+            return describe_sync(None)
+        return describe_sync(min(synced))
+
+    def _is_fresh(self, projects: list[str]) -> bool:
+        age = self.freshness(projects)["age_s"]
+        return age is not None and age <= self.max_staleness
+
+    def _has_fields(self, raw: Optional[dict], field_ids: Optional[str]) -> bool:
+        """Whether the mirror stores every requested field; explicit fields are checked against a stored issue when given"""
+        mirrored = self.fields.split(",")
+        stored = (raw or {}).get("fields")
+        for field in (field_ids or "*all").split(","):
+            if field.startswith("-"):
+                continue
+            if field == "*all":
+                if "*all" not in mirrored:
+                    return False
+            elif field.startswith("*"):
+                if "*all" not in mirrored and field not in mirrored:
+                    return False
+            elif stored is not None and field not in stored:
+                return False
+        return True
+
+    @staticmethod
+    def _select(raw: dict, field_ids: Optional[str]) -> dict:
+        """Restrict raw issue JSON to the requested field ids, as the REST API would"""
+        requested = field_ids.split(",") if field_ids else []
+        wanted = {field for field in requested if not field.startswith("-")}
+        if not wanted or any(field.startswith("*") for field in wanted):
+            return raw
+        return {**raw, "fields": {k: v for k, v in (raw.get("fields") or {}).items() if k in wanted}}
+
+    def get_issue(self, issue_key: str, field_ids: Optional[str] = None) -> Optional[MirrorIssue]:
+        """Mirrored issue, or None when it is not mirrored, stale, or lacks a requested field"""
+        project = issue_key.rpartition("-")[0].upper()
+        if project not in self.projects or not self._is_fresh([project]):
+            return None
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT raw, sync_state.synced_at FROM issues JOIN sync_state ON sync_state.project = issues.project "
+                "WHERE key = ? AND key NOT IN (SELECT key FROM stale_issues)",
+                (issue_key.upper(),),
+            ).fetchone()
+        if row is None:
+            return None
+        raw = json.loads(row[0])
+        return MirrorIssue(self._select(raw, field_ids), row[1]) if self._has_fields(raw, field_ids) else None
+
+    def projects_of(self, query: str) -> Optional[list[str]]:
+        """Mirrored projects a query is restricted to, or None when the mirror cannot answer it"""
+        if not self.enabled:
+            return None
+        try:
+            clauses, _ = parse_jql(query)
+        except UnsupportedQuery:
+            return None
+        for field, operator, operand in clauses:
+            if field != "project" or operator not in ("=", "in"):
+                continue
+            values = operand if operator == "in" else (operand,)
+            if any(kind != "value" for kind, _ in values):
+                return None
+            projects = [text.upper() for _, text in values]
+            if all(project in self.projects for project in projects) and self._is_fresh(projects) and not self._has_stale(projects):
+                return projects
+        return None
+
+    def covers(self, query: str, field_ids: Optional[str] = None, expand: Optional[str] = None) -> bool:
+        """Whether search_issues(query) can be answered from the mirror"""
+        if expand or self.projects_of(query) is None:
+            return False
+        try:
+            self._where(parse_jql(query)[0])
+        except UnsupportedQuery:
+            return False
+        with self._lock:
+            row = self._connection().execute("SELECT raw FROM issues LIMIT 1").fetchone()
+        return self._has_fields(json.loads(row[0]) if row else None, field_ids)
+
+    def _where(self, clauses) -> tuple[str, list]:
+        conditions = []
+        params = []
+        current_user = None
+        for field, operator, operand in clauses:
+            values = operand if operator in ("in", "not in") else (operand,) if operand else ()
+            texts = []
+            for kind, text in values:
+                if kind == "function":
+                    if field != "assignee" or text != "currentuser":
+                        raise UnsupportedQuery(text)
+                    if current_user is None:
+                        with self._lock:
+                            current_user = self._meta("current_user", [])
+                    texts.extend(current_user)
+                elif field in ("created", "updated"):
+                    texts.append(self._parse_date(text))
+                else:
+                    texts.append(text)
+            placeholders = ",".join("?" * len(texts))
+            negate = operator in ("!=", "not in")
+
+            if field in ("created", "updated"):
+                conditions.append(f"{field} {operator} ?")
+                params.append(texts[0])
+            elif field == "labels":
+                if operator in ("is empty", "is not empty"):
+                    exists = "EXISTS (SELECT 1 FROM issue_labels l WHERE l.key = issues.key)"
+                    conditions.append(exists if operator == "is not empty" else "NOT " + exists)
+                else:
+                    exists = f"EXISTS (SELECT 1 FROM issue_labels l WHERE l.key = issues.key AND l.label IN ({placeholders}))"
+                    # Like Jira, != and NOT IN do not match issues without any label
+                    any_label = "EXISTS (SELECT 1 FROM issue_labels l WHERE l.key = issues.key)"
+                    conditions.append(f"({any_label} AND NOT {exists})" if negate else exists)
+                    params.extend(texts)
+            elif field == "assignee":
+                if operator in ("is empty", "is not empty"):
+                    conditions.append("assignee_id IS NULL" if operator == "is empty" else "assignee_id IS NOT NULL")
+                else:
+                    match = f"(lower(assignee_id) IN ({placeholders}) OR lower(assignee_name) IN ({placeholders}))"
+                    lowered = [text.lower() for text in texts]
+                    conditions.append(f"(assignee_id IS NOT NULL AND NOT {match})" if negate else match)
+                    params.extend(lowered + lowered)
+            else:
+                column = _COLUMNS[field]
+                lowered = [text.upper() if field in ("project", "key") else text.lower() for text in texts]
+                expression = column if field in ("project", "key") else f"lower({column})"
+                conditions.append(f"{expression} {'NOT IN' if negate else 'IN'} ({placeholders})")
+                params.extend(lowered)
+        return " AND ".join(conditions) or "1", params
+
+    def _parse_date(self, text: str) -> str:
+        relative = _RELATIVE.match(text)
+        if relative:
+            moment = datetime.now(timezone.utc) + timedelta(**{_UNITS[relative.group(2)]: int(relative.group(1))})
+            return moment.strftime("%Y-%m-%d %H:%M:%S")
+        for date_format in _DATE_FORMATS:
+            try:
+                local = datetime.strptime(text, date_format).replace(tzinfo=self._timezone())
+            except ValueError:
+                continue
+            return local.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        raise UnsupportedQuery(text)
+
+    def search_issues(self, jql_str: str, startAt: int = 0, maxResults: int = 50, fields=None, expand=None, **kwargs) -> ResultList:
+        """Answer a supported JQL query locally; same call shape as JIRA.search_issues"""
+        clauses, order_by = parse_jql(jql_str)
+        where, params = self._where(clauses)
+        order = ", ".join(
+            "issues.project {0}, number {0}".format(direction) if field == "key" else f"{field} {direction}"
+            for field, direction in order_by or (("key", "DESC"),)
+        )
+        with self._lock:
+            db = self._connection()
+            total = db.execute(f"SELECT COUNT(*) FROM issues WHERE {where}", params).fetchone()[0]
+            rows = db.execute(
+                f"SELECT raw, sync_state.synced_at FROM issues JOIN sync_state ON sync_state.project = issues.project WHERE {where} ORDER BY {order} LIMIT ? OFFSET ?",
+                params + [maxResults, startAt],
+            ).fetchall()
+        return ResultList([MirrorIssue(self._select(json.loads(raw), fields), synced_at) for raw, synced_at in rows], total, startAt, maxResults)
+
+    def status(self) -> dict:
+        """Mirrored projects with their sync state and issue counts"""
+        if not self.enabled:
+            return {"enabled": False}
+        with self._lock:
+            db = self._connection()
+            state = {project: {"watermark": watermark, "synced_at": synced_at} for project, watermark, synced_at in db.execute("SELECT project, watermark, synced_at FROM sync_state")}
+            counts = dict(db.execute("SELECT project, COUNT(*) FROM issues GROUP BY project").fetchall())
+            stale = dict(db.execute("SELECT project, COUNT(*) FROM stale_issues GROUP BY project").fetchall())
+        projects = {}
+        for project in self.projects:
+            freshness = describe_sync((state.get(project) or {}).get("synced_at"))
+            projects[project] = {
+                "issues": counts.get(project, 0),
+                "stale_issues": stale.get(project, 0),
+                "watermark": (state.get(project) or {}).get("watermark"),
+                "synced_at": freshness["synced_at"],
+                "age_s": freshness["age_s"],
+            }
+        return {"enabled": True, "path": self.path, "max_staleness_s": self.max_staleness, "last_error": self.last_error, "projects": projects}
+
+    def start_background_sync(self, client, interval: float) -> None:
+        """Sync every interval seconds in a daemon thread; failures are logged, reported by status() and retried on the next round"""
+        def loop():
+            while True:
+                try:
+                    self.sync(client)
+                    self.last_error = None
+                except Exception as e:
+                    logger.exception("Background sync of the issue mirror failed")
+                    self.last_error = {"at": datetime.now(timezone.utc).isoformat(timespec="seconds"), "error": f"{type(e).__name__}: {e}"}
+                time.sleep(interval)
+        threading.Thread(target=loop, name="jira-mirror-sync", daemon=True).start()
+
+
+# Global mirror instance; disabled unless JIRA_MIRROR_PROJECTS is set
+mirror = IssueMirror(
+    path=config.mirror_path,
+    projects=config.mirror_projects,
+    fields=config.mirror_fields,
+    max_staleness=config.mirror_max_staleness,
+)
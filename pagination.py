@@ -0,0 +1,111 @@
+import base64
+import json
+from collections import deque
+from typing import Callable, Iterator, Optional
+
+from runtime import submit
+
+
+def wire_size(value) -> int:
+    """Bytes a list element takes in a tool response, which is serialized as JSON indented by 2 with the list at nesting depth 2"""
+    text = json.dumps(value, indent=2, default=str)
+    return len(text) + 4 * (text.count("\n") + 1) + 2
+
+
+def encode_cursor(query: str, start_at: int) -> str:
+    """Encode a resumable search position as an opaque token"""
+    payload = json.dumps({"jql": query, "start_at": start_at}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[str, int]:
+    """Decode a token produced by encode_cursor into (query, start_at)"""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return payload["jql"], int(payload["start_at"])
+    except (ValueError, KeyError, TypeError):
+        raise ValueError("Invalid cursor")
+
+
+class IssuePager:
+    """Walks JQL search results page by page, fetching the next pages ahead of the consumer"""
+
+    def __init__(self, client, query: str, fields: str = "summary", expand: Optional[str] = None, page_size: int = 100, prefetch: int = 4, validate_query: bool = True):
+        self.client = client
+        self.query = query
+        self.fields = fields
+        self.expand = expand
+        self.page_size = page_size
+        self.prefetch = max(1, prefetch)
+        self.validate_query = validate_query
+        self.total: Optional[int] = None
+
+    def _fetch(self, start_at: int):
+        return self.client.search_issues(self.query, startAt=start_at, maxResults=self.page_size, fields=self.fields, expand=self.expand, validate_query=self.validate_query)
+
+    def pages(self, start_at: int = 0, limit: Optional[int] = None) -> Iterator[tuple[int, list]]:
+        """Yield (start_at, issues) in order while up to `prefetch` later pages are in flight.
+        With a limit, no page starting `limit` or more issues after start_at is requested"""
+        end = None if limit is None else start_at + max(1, limit)
+        if end is not None:
+            self.page_size = min(self.page_size, end - start_at)
+        first = self._fetch(start_at)
+        self.total = getattr(first, "total", None)
+        yield start_at, list(first)
+        if self.total is not None and first and start_at + len(first) < self.total:
+            # The server caps maxResults below what we asked for; page by what it actually returns
+            self.page_size = len(first)
+        elif len(first) < self.page_size:
+            return
+
+        pending = deque()
+        next_offset = start_at + self.page_size
+        try:
+            while True:
+                while len(pending) < self.prefetch and (self.total is None or next_offset < self.total) and (end is None or next_offset < end):
+                    pending.append((next_offset, submit(self._fetch, next_offset)))
+                    next_offset += self.page_size
+                if not pending:
+                    return
+                offset, future = pending.popleft()
+                issues = list(future.result())
+                yield offset, issues
+                if len(issues) < self.page_size:
+                    return
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+    def collect(self, start_at: int, shape: Callable, max_rows: int = 1000, max_bytes: Optional[int] = None) -> dict:
+        """Collect shaped rows until results, max_rows or max_bytes run out; return them with a resume cursor"""
+        rows = []
+        size = 0
+        position = start_at
+        exhausted = True
+        pages = self.pages(start_at, limit=max_rows)
+        try:
+            for offset, issues in pages:
+                position = offset
+                for issue in issues:
+                    row = shape(issue)
+                    row_size = wire_size(row)
+                    if len(rows) >= max_rows or (max_bytes is not None and rows and size + row_size > max_bytes):
+                        exhausted = False
+                        break
+                    rows.append(row)
+                    size += row_size
+                    position += 1
+                if not exhausted:
+                    break
+        finally:
+            pages.close()
+
+        if exhausted and self.total is not None and position < self.total:
+            exhausted = False
+        return {
+            "issues": rows,
+            "total": self.total,
+            "returned": len(rows),
+            "bytes": size,
+            "next_cursor": None if exhausted else encode_cursor(self.query, position),
+        }
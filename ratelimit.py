@@ -0,0 +1,157 @@
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from config import config
+from sites import SiteLocal
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header given as seconds or an HTTP date"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RequestScheduler:
+    """Token bucket shared by every session talking to one Jira site.
+
+    Without an initial rate requests are not paced until the server pushes back. The rate then adapts
+    to the server: it is set from X-RateLimit-FillRate / X-RateLimit-Interval-Seconds when Jira sends
+    them, halves on 429 (at most once a second), and creeps back up while requests succeed; pacing stops
+    again once it is back at max_rate.
+    Retry-After pauses all requests until it expires. Tokens are handed out first come, first served,
+    and writes additionally go through a FIFO queue that bounds how many run at once"""
+
+    def __init__(self, rate: Optional[float] = None, burst: int = 10, min_rate: float = 0.5, max_rate: float = 100.0, write_concurrency: int = 4):
+        # Whether requests are paced by the token bucket; until then only Retry-After pauses apply
+        self.limited = bool(rate)
+        self.rate = rate if rate else max_rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.write_concurrency = max(1, write_concurrency)
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+        self._lock = threading.Lock()
+        self._writes = threading.Condition()
+        self._write_tickets = 0
+        self._write_serving = 0
+        self._writes_active = 0
+        self.throttled = 0
+        self.retries = 0
+        self.waited = 0.0
+
+    def acquire(self) -> None:
+        """Block until a request may be sent"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            wait = self._paused_until - now
+            if self.limited:
+                # Going negative reserves a future token, which keeps callers in arrival order
+                self._tokens -= 1
+                wait = max(wait, -self._tokens / self.rate if self._tokens < 0 else 0.0)
+            wait = max(0.0, wait)
+            self.waited += wait
+        if wait > 0:
+            time.sleep(wait)
+
+    def acquire_write(self) -> None:
+        """Wait for a write slot; writes are admitted strictly in arrival order"""
+        with self._writes:
+            ticket = self._write_tickets
+            self._write_tickets += 1
+            self._writes.wait_for(lambda: ticket == self._write_serving and self._writes_active < self.write_concurrency)
+            self._write_serving += 1
+            self._writes_active += 1
+            self._writes.notify_all()
+
+    def release_write(self) -> None:
+        with self._writes:
+            self._writes_active -= 1
+            self._writes.notify_all()
+
+    def observe(self, response) -> None:
+        """Adjust the rate from a response's status and rate limit headers"""
+        headers = response.headers
+        with self._lock:
+            fill_rate = headers.get("X-RateLimit-FillRate")
+            interval = headers.get("X-RateLimit-Interval-Seconds")
+            limit = headers.get("X-RateLimit-Limit")
+            if fill_rate and interval:
+                try:
+                    self.rate = min(self.max_rate, max(self.min_rate, float(fill_rate) / float(interval)))
+                    self._limit()
+                except (ValueError, ZeroDivisionError):
+                    pass
+            if limit:
+                try:
+                    self.burst = max(1, int(limit))
+                except ValueError:
+                    pass
+
+            if response.status_code == 429:
+                self.throttled += 1
+                now = time.monotonic()
+                # One decrease per second, so a burst of concurrent 429s does not collapse the rate
+                if now - self._last_decrease >= 1.0:
+                    self.rate = max(self.min_rate, self.rate / 2)
+                    self._last_decrease = now
+                    self._limit()
+                retry_after = parse_retry_after(headers.get("Retry-After"))
+                if retry_after:
+                    self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+            elif response.status_code < 400 and not fill_rate:
+                remaining = headers.get("X-RateLimit-Remaining")
+                if remaining is not None and remaining.isdigit() and int(remaining) == 0:
+                    self.rate = max(self.min_rate, self.rate * 0.75)
+                    self._limit()
+                else:
+                    self.rate = min(self.max_rate, self.rate + 0.1)
+                    if self.rate >= self.max_rate:
+                        self.limited = False
+
+    def _limit(self) -> None:
+        """Start pacing requests with an empty bucket (caller holds the lock)"""
+        if not self.limited:
+            self.limited = True
+            self._tokens = 0.0
+            self._updated = time.monotonic()
+
+    def record_retry(self) -> None:
+        with self._lock:
+            self.retries += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "limited": self.limited,
+                "rate_per_s": round(self.rate, 3),
+                "burst": self.burst,
+                "throttled_responses": self.throttled,
+                "retries": self.retries,
+                "total_wait_s": round(self.waited, 3),
+                "paused_for_s": round(max(0.0, self._paused_until - time.monotonic()), 3),
+            }
+
+
+# Global scheduler proxy: one scheduler per Jira site, shared by all clients of that site
+scheduler = SiteLocal(lambda site: RequestScheduler(
+    rate=site.rate_limit,
+    burst=config.rate_burst,
+    min_rate=config.rate_limit_min,
+    max_rate=config.rate_limit_max,
+    write_concurrency=config.write_concurrency,
+))
@@ -0,0 +1,137 @@
+import asyncio
+import contextvars
+import inspect
+import json
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial, wraps
+from typing import Annotated, Optional
+
+from mcp.server.fastmcp import Context, FastMCP
+from pydantic import Field
+
+from config import config
+from metrics import current_tool, metrics
+from singleflight import single_flight
+from sites import SiteLocal, current_site, site_name
+
+# Runs tool bodies; its size is the number of tool calls served concurrently. Each site has its own
+# pool, so calls stuck on a slow site (including timed out ones still running) never hold up another site
+tool_executor = SiteLocal(lambda site: ThreadPoolExecutor(max_workers=max(1, site.max_concurrency), thread_name_prefix=f"jira-tool-{site.name}"))
+
+# Runs fan-out requests issued from inside a tool (page prefetch, batch operations), per site as well
+io_executor = SiteLocal(lambda site: ThreadPoolExecutor(max_workers=config.io_workers, thread_name_prefix=f"jira-io-{site.name}"))
+
+# Event loop that dispatched the current tool call, so worker threads can post notifications back to it
+event_loop: contextvars.ContextVar = contextvars.ContextVar("event_loop", default=None)
+
+
+def submit(fn, *args, **kwargs) -> Future:
+    """Submit fn to the current site's io executor, carrying over the caller's context variables"""
+    return io_executor.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
+def report_progress(ctx, progress: float, total: float = None) -> None:
+    """Send a progress notification for the current tool call from a worker thread without waiting for it"""
+    loop = event_loop.get()
+    if ctx is None or loop is None or loop.is_closed():
+        return
+    asyncio.run_coroutine_threadsafe(ctx.report_progress(progress, total), loop)
+
+
+def offload(fn, timeout: float = None):
+    """Wrap a blocking tool function into a coroutine that runs it on the site's tool executor"""
+    timeout = config.tool_timeout if timeout is None else timeout
+
+    @wraps(fn)
+    async def wrapper(*args, **kwargs):
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        context.run(event_loop.set, loop)
+        call = partial(context.run, fn, *args, **kwargs)
+        future = loop.run_in_executor(tool_executor.for_site(), call)
+        try:
+            return await asyncio.wait_for(future, timeout=timeout or None)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"{fn.__name__} did not finish within {timeout}s")
+    return wrapper
+
+
+SiteArgument = Annotated[Optional[str], Field(description="Jira site to run against, one of the sites configured with JIRA_SITES; defaults to the default site")]
+
+
+def with_site(fn):
+    """Add an optional `site` argument to a tool; the call runs with current_site set to it"""
+    @wraps(fn)
+    async def wrapper(*args, site: str = None, **kwargs):
+        token = current_site.set(site_name(site))
+        try:
+            return await fn(*args, **kwargs)
+        finally:
+            current_site.reset(token)
+
+    signature = inspect.signature(fn)
+    parameters = list(signature.parameters.values())
+    parameters.append(inspect.Parameter("site", inspect.Parameter.KEYWORD_ONLY, default=None, annotation=SiteArgument))
+    wrapper.__signature__ = signature.replace(parameters=parameters)
+    wrapper.__annotations__ = {**fn.__annotations__, "site": SiteArgument}
+    return wrapper
+
+
+def _response_size(result) -> int:
+    """Approximate wire size of a converted tool result"""
+    if isinstance(result, tuple):
+        result = result[0]
+    if isinstance(result, dict):
+        return len(json.dumps(result, default=str))
+    return sum(len(getattr(block, "text", None) or "") for block in result)
+
+
+def _read_only(annotations) -> bool:
+    """Whether tool annotations (dict or ToolAnnotations) carry readOnlyHint"""
+    if isinstance(annotations, dict):
+        return bool(annotations.get("readOnlyHint"))
+    return bool(getattr(annotations, "readOnlyHint", False))
+
+
+def _takes_context(fn) -> bool:
+    """Whether a tool function has a Context parameter, detected the way FastMCP's Tool.from_function does"""
+    return any(inspect.isclass(parameter.annotation) and issubclass(parameter.annotation, Context) for parameter in inspect.signature(fn).parameters.values())
+
+
+class JiraMCP(FastMCP):
+    """FastMCP server that runs synchronous tools on a bounded worker pool instead of the event loop,
+    routes every tool to the Jira site named by its optional `site` argument, coalesces identical
+    concurrent calls to read-only tools, and records latency, response size and upstream calls for every tool"""
+
+    def tool(self, *args, timeout: float = None, **kwargs):
+        """FastMCP.tool with an optional per-tool timeout in seconds replacing JIRA_TOOL_TIMEOUT (0 disables)"""
+        register = super().tool(*args, **kwargs)
+        if timeout is None:
+            return register
+
+        def decorator(fn):
+            register(fn if inspect.iscoroutinefunction(fn) else offload(fn, timeout))
+            return fn
+        return decorator
+
+    def add_tool(self, fn, *args, **kwargs) -> None:
+        if not inspect.iscoroutinefunction(fn):
+            fn = offload(fn)
+        # Calls taking a Context report progress to their own client, so they are never shared
+        if config.coalesce and _read_only(kwargs.get("annotations")) and not _takes_context(fn):
+            fn = single_flight.wrap(kwargs.get("name") or fn.__name__, fn)
+        super().add_tool(with_site(fn), *args, **kwargs)
+
+    async def call_tool(self, name: str, arguments: dict):
+        token = current_tool.set(name)
+        start = time.perf_counter()
+        try:
+            result = await super().call_tool(name, arguments)
+        except Exception:
+            metrics.record_call(name, time.perf_counter() - start, error=True)
+            raise
+        finally:
+            current_tool.reset(token)
+        metrics.record_call(name, time.perf_counter() - start, response_bytes=_response_size(result))
+        return result
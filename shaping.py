@@ -0,0 +1,119 @@
+from typing import Any, Optional
+
+from pagination import decode_cursor, encode_cursor, wire_size
+
+# Slim schema per resource: (output name, dotted path in the REST representation)
+SCHEMAS = {
+    "field": [("id", "id"), ("name", "name"), ("custom", "custom"), ("type", "schema.type"), ("items", "schema.items"), ("custom_type", "schema.custom")],
+    "user": [("accountId", "accountId"), ("name", "name"), ("displayName", "displayName"), ("email", "emailAddress"), ("active", "active"), ("timeZone", "timeZone"), ("accountType", "accountType")],
+    "comment": [("id", "id"), ("author", "author.displayName"), ("body", "body"), ("created", "created"), ("updated", "updated"), ("visibility", "visibility")],
+    "group": [("name", "name")],
+}
+
+RESPONSE_FORMATS = ("objects", "columns")
+
+
+def compact(value: Any) -> Any:
+    """Recursively drop None, empty strings, empty lists and empty dicts"""
+    if isinstance(value, dict):
+        result = {}
+        for key, item in value.items():
+            item = compact(item)
+            if item is not None and item != "" and item != [] and item != {}:
+                result[key] = item
+        return result
+    if isinstance(value, list):
+        return [item for item in (compact(item) for item in value) if item is not None and item != "" and item != [] and item != {}]
+    return value
+
+
+def resolve_field_ids(requested: Optional[str], fields_meta: list[dict]) -> Optional[str]:
+    """Translate a comma separated list of field ids or names into field ids for the REST call.
+    Special values like '*all', '*navigable' and '-comment' are passed through unchanged"""
+    if not requested:
+        return requested
+    by_name = {}
+    for field in fields_meta:
+        by_name.setdefault(field["name"].lower(), field["id"])
+    known_ids = {field["id"] for field in fields_meta}
+    resolved = []
+    for item in requested.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        if item.startswith(("*", "-")) or item in known_ids:
+            resolved.append(item)
+        else:
+            resolved.append(by_name.get(item.lower(), item))
+    return ",".join(resolved)
+
+
+def custom_field_names(fields_meta: list[dict]) -> dict[str, str]:
+    """Map custom field ids to their human names, skipping names shared by several fields"""
+    names = {}
+    seen = {}
+    for field in fields_meta:
+        if field.get("custom"):
+            seen[field["name"]] = seen.get(field["name"], 0) + 1
+            names[field["id"]] = field["name"]
+    return {field_id: name for field_id, name in names.items() if seen[name] == 1}
+
+
+def issue_to_dict(raw: dict, names: Optional[dict] = None, compact_output: bool = False) -> dict:
+    """Shape raw issue JSON into {key, id, fields, ...} with custom field ids renamed"""
+    fields = raw.get("fields") or {}
+    if names:
+        fields = {names.get(field_id, field_id): value for field_id, value in fields.items()}
+    result = {"key": raw.get("key"), "id": raw.get("id"), "fields": fields}
+    for extra in ("renderedFields", "changelog", "names", "transitions"):
+        if extra in raw:
+            result[extra] = raw[extra]
+    return compact(result) if compact_output else result
+
+
+def slim(raw: Any, resource: str) -> dict:
+    """Project a REST dict or jira resource onto the slim schema of resource, dropping missing values"""
+    raw = getattr(raw, "raw", raw)
+    result = {}
+    for name, path in SCHEMAS[resource]:
+        value = raw
+        for part in path.split("."):
+            value = value.get(part) if isinstance(value, dict) else None
+        if value is not None:
+            result[name] = value
+    return result
+
+
+def encode_list(rows: list[dict], resource: str, scope: str, fmt: str = "objects", max_bytes: Optional[int] = None, cursor: Optional[str] = None) -> dict:
+    """Encode slim rows as {items} or as {columns, rows} of values, keeping the rows within about max_bytes of response text.
+
+    scope identifies the listing (e.g. the tool and its arguments); it is stored in next_cursor so a cursor
+    can only resume the listing it came from"""
+    if fmt not in RESPONSE_FORMATS:
+        raise ValueError(f"format must be one of {', '.join(RESPONSE_FORMATS)}")
+    start = 0
+    if cursor:
+        cursor_scope, start = decode_cursor(cursor)
+        if cursor_scope != scope:
+            raise ValueError("Cursor belongs to a different listing")
+
+    columns = [name for name, _ in SCHEMAS[resource] if any(name in row for row in rows)]
+    encode = (lambda row: [row.get(column) for column in columns]) if fmt == "columns" else (lambda row: row)
+    selected = []
+    size = 0
+    for row in rows[start:]:
+        value = encode(row)
+        row_size = wire_size(value)
+        if max_bytes and selected and size + row_size > max_bytes:
+            break
+        selected.append(value)
+        size += row_size
+
+    end = start + len(selected)
+    result = {"total": len(rows), "returned": len(selected), "next_cursor": encode_cursor(scope, end) if end < len(rows) else None}
+    if fmt == "columns":
+        result["columns"] = columns
+        result["rows"] = selected
+    else:
+        result["items"] = selected
+    return result
@@ -0,0 +1,86 @@
+import asyncio
+import json
+import time
+from collections import defaultdict
+from functools import wraps
+
+from config import config
+from sites import current_site
+
+
+class SingleFlight:
+    """Shares one in-flight execution among concurrent calls with identical arguments.
+
+    Finished results can optionally be reused for a short window afterwards. Errors are
+    shared with the calls waiting at that moment but never reused"""
+
+    def __init__(self, window: float = 0.0):
+        self.window = window
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._recent: dict[str, tuple[float, object]] = {}
+        self._stats = defaultdict(lambda: {"calls": 0, "executions": 0, "coalesced": 0, "window_hits": 0})
+
+    @staticmethod
+    def make_key(name: str, kwargs: dict) -> str:
+        """Key of a call: the site it runs against, the tool and its arguments"""
+        return f"{current_site.get()}:{name}:" + json.dumps(kwargs, sort_keys=True, default=str)
+
+    async def run(self, name: str, key: str, factory):
+        """Await factory() unless an identical call is already running or finished within the window"""
+        stats = self._stats[name]
+        stats["calls"] += 1
+
+        if self.window > 0:
+            recent = self._recent.get(key)
+            if recent is not None:
+                if recent[0] > time.monotonic():
+                    stats["window_hits"] += 1
+                    return recent[1]
+                del self._recent[key]
+
+        future = self._inflight.get(key)
+        if future is not None:
+            stats["coalesced"] += 1
+            return await asyncio.shield(future)
+
+        stats["executions"] += 1
+        future = asyncio.ensure_future(factory())
+        self._inflight[key] = future
+        future.add_done_callback(lambda done: self._finish(key, done))
+        # Shielded so that a cancelled first caller does not cancel the call others are waiting on
+        return await asyncio.shield(future)
+
+    def _finish(self, key: str, future: asyncio.Future) -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        if self.window > 0 and not future.cancelled() and future.exception() is None:
+            now = time.monotonic()
+            for stale in [k for k, (expires_at, _) in self._recent.items() if expires_at <= now]:
+                del self._recent[stale]
+            self._recent[key] = (now + self.window, future.result())
+
+    def wrap(self, name: str, fn):
+        """Coalesce calls to an async tool function"""
+        @wraps(fn)
+        async def wrapper(*args, **kwargs):
+            if args:
+                return await fn(*args, **kwargs)
+            return await self.run(name, self.make_key(name, kwargs), lambda: fn(**kwargs))
+        return wrapper
+
+    def stats(self) -> dict:
+        """Per-tool counters and totals; saved counts upstream executions avoided"""
+        tools = {name: dict(counters) for name, counters in sorted(self._stats.items())}
+        calls = sum(counters["calls"] for counters in tools.values())
+        executions = sum(counters["executions"] for counters in tools.values())
+        return {
+            "window_s": self.window,
+            "calls": calls,
+            "executions": executions,
+            "saved": calls - executions,
+            "tools": tools,
+        }
+
+
+# Global single-flight group for read-only tools
+single_flight = SingleFlight(window=config.coalesce_window)
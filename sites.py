@@ -0,0 +1,42 @@
+import contextvars
+import threading
+from typing import Callable, Optional
+
+from config import SiteConfig, config
+
+# Jira site the current tool call works against; empty means the default site
+current_site: contextvars.ContextVar[str] = contextvars.ContextVar("current_site", default="")
+
+
+def site_name(name: Optional[str] = None) -> str:
+    """Resolve a site name (or the current call's site) to a configured site name"""
+    return config.site(name or current_site.get()).name
+
+
+def is_default_site() -> bool:
+    """Whether the current tool call works against the default site"""
+    return site_name() == config.default_site
+
+
+class SiteLocal:
+    """Proxy forwarding attribute access to a per-site instance for the current tool call's site.
+    Instances are created by factory(SiteConfig) on first use and kept for the life of the process"""
+
+    def __init__(self, factory: Callable[[SiteConfig], object]):
+        self._factory = factory
+        self._instances: dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def for_site(self, name: Optional[str] = None):
+        """Return the instance for a site (default: the current site), creating it on first use"""
+        name = site_name(name)
+        instance = self._instances.get(name)
+        if instance is None:
+            with self._lock:
+                instance = self._instances.get(name)
+                if instance is None:
+                    instance = self._instances[name] = self._factory(config.site(name))
+        return instance
+
+    def __getattr__(self, name):
+        return getattr(self.for_site(), name)
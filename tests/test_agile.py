@@ -0,0 +1,95 @@
+"""Sprint summaries and board estimation fields.
+
+    python -m unittest discover tests
+"""
+import sys
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from agile import estimation_field, summarize_sprint  # noqa: E402
+
+POINTS = "customfield_10016"
+
+
+def issue(key, status, category, assignee=None, points=None, remaining=None, spent=None, original=None):
+    return {"key": key, "fields": {
+        "summary": f"Issue {key}",
+        "status": {"name": status, "statusCategory": {"key": category}},
+        "assignee": {"displayName": assignee} if assignee else None,
+        POINTS: points,
+        "timeestimate": remaining,
+        "timespent": spent,
+        "timeoriginalestimate": original,
+    }}
+
+
+class EstimationFieldTest(unittest.TestCase):
+
+    def test_field_estimation(self):
+        configuration = {"estimation": {"type": "field", "field": {"fieldId": POINTS, "displayName": "Story Points"}}}
+        self.assertEqual(estimation_field(configuration), {"id": POINTS, "name": "Story Points"})
+
+    def test_name_defaults_to_the_field_id(self):
+        configuration = {"estimation": {"type": "field", "field": {"fieldId": "timeoriginalestimate"}}}
+        self.assertEqual(estimation_field(configuration), {"id": "timeoriginalestimate", "name": "timeoriginalestimate"})
+
+    def test_issue_count_boards_have_no_field(self):
+        self.assertIsNone(estimation_field({"estimation": {"type": "issueCount"}}))
+        self.assertIsNone(estimation_field({"estimation": {"type": "field", "field": {}}}))
+        self.assertIsNone(estimation_field({}))
+
+
+class SummarizeSprintTest(unittest.TestCase):
+
+    def setUp(self):
+        self.issues = [
+            issue("A-1", "Done", "done", "Alice", points=5, remaining=3600, spent=7200),
+            issue("A-2", "In Progress", "indeterminate", "Alice", points=3, remaining=5400, spent=1800),
+            issue("A-3", "Open", "new", points="2", remaining=1800),
+            issue("A-4", "Open", "new", "Bob"),
+        ]
+
+    def test_totals(self):
+        totals = summarize_sprint(self.issues, POINTS)["totals"]
+        self.assertEqual(totals, {
+            "issues": 4,
+            "estimate": 10.0,
+            "completed_estimate": 5.0,
+            # Remaining time of done issues is not counted
+            "remaining_h": 2.0,
+            "spent_h": 2.5,
+            "unestimated": 1,
+        })
+
+    def test_grouped_by_status_and_assignee(self):
+        summary = summarize_sprint(self.issues, POINTS)
+        self.assertEqual(list(summary["by_status"]), ["Done", "In Progress", "Open"])
+        self.assertEqual(summary["by_status"]["Open"], {"issues": 2, "estimate": 2.0, "remaining_h": 0.5})
+        self.assertEqual(summary["by_assignee"]["Alice"], {"issues": 2, "estimate": 8.0, "remaining_h": 1.5})
+        self.assertEqual(summary["by_assignee"]["Unassigned"]["issues"], 1)
+
+    def test_issue_rows_are_compact(self):
+        rows = summarize_sprint(self.issues, POINTS)["issues"]
+        self.assertEqual(rows[0], {"key": "A-1", "summary": "Issue A-1", "status": "Done", "done": True, "assignee": "Alice", "estimate": 5, "remaining_h": 1.0})
+        self.assertNotIn("estimate", rows[3])
+
+    def test_time_estimates_are_reported_in_hours(self):
+        issues = [issue("A-1", "Open", "new", original=9000), issue("A-2", "Open", "new", original=1800)]
+        summary = summarize_sprint(issues, "timeoriginalestimate")
+        self.assertEqual(summary["totals"]["estimate"], 3.0)
+        self.assertEqual(summary["issues"][0]["estimate"], 2.5)
+
+    def test_without_estimate_field(self):
+        totals = summarize_sprint(self.issues)["totals"]
+        self.assertEqual((totals["issues"], totals["estimate"], totals["unestimated"]), (4, 0.0, 0))
+
+    def test_accepts_jira_resources(self):
+        summary = summarize_sprint([SimpleNamespace(raw=raw) for raw in self.issues], POINTS)
+        self.assertEqual(summary, summarize_sprint(self.issues, POINTS))
+
+
+if __name__ == "__main__":
+    unittest.main()
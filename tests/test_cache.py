@@ -0,0 +1,85 @@
+"""MetadataCache TTL, LRU eviction, invalidation and persistence.
+
+    python -m unittest discover tests
+"""
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cache import MetadataCache  # noqa: E402
+
+
+class MetadataCacheTest(unittest.TestCase):
+
+    def test_entries_expire_after_their_ttl(self):
+        cache = MetadataCache(default_ttl=10, ttls={"fields": 100})
+        now = time.time()
+        with mock.patch("cache.time.time", return_value=now):
+            cache.set("projects", 1, cache.ttl_for("projects"))
+            cache.set("fields", 2, cache.ttl_for("fields"))
+        with mock.patch("cache.time.time", return_value=now + 50):
+            self.assertEqual(cache.get("projects"), (False, None))
+            self.assertEqual(cache.get("fields"), (True, 2))
+        self.assertEqual(cache.stats()["entries"], 1)
+
+    def test_zero_ttl_is_not_stored(self):
+        cache = MetadataCache(ttls={"statuses": 0})
+        cache.set("statuses", 1, cache.ttl_for("statuses"))
+        self.assertEqual(cache.get("statuses"), (False, None))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = MetadataCache(max_entries=2)
+        cache.set("a", 1, 60)
+        cache.set("b", 2, 60)
+        cache.get("a")
+        cache.set("c", 3, 60)
+        self.assertEqual(cache.get("b"), (False, None))
+        self.assertEqual(cache.get("a"), (True, 1))
+        self.assertEqual(cache.get("c"), (True, 3))
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_invalidate_one_key_or_a_whole_resource(self):
+        cache = MetadataCache()
+        for key in ("project_versions:A", "project_versions:B", "projects", "projects_archived"):
+            cache.set(key, key, 60)
+        self.assertEqual(cache.invalidate("project_versions", "A"), 1)
+        self.assertEqual(cache.get("project_versions:B"), (True, "project_versions:B"))
+        self.assertEqual(cache.invalidate("projects"), 1)
+        self.assertEqual(cache.get("projects_archived"), (True, "projects_archived"))
+        self.assertEqual(cache.clear(), 2)
+
+    def test_cached_keys_on_bound_arguments(self):
+        cache = MetadataCache()
+        calls = []
+
+        @cache.cached("project_components")
+        def components(project_key: str, archived: bool = False):
+            calls.append(project_key)
+            return [project_key, archived]
+
+        self.assertEqual(components("A"), ["A", False])
+        self.assertEqual(components(project_key="A"), ["A", False])
+        self.assertEqual(components("B"), ["B", False])
+        self.assertEqual(calls, ["A", "B"])
+        self.assertEqual(cache.stats()["hits"], 1)
+
+    def test_unexpired_entries_are_persisted_between_instances(self):
+        path = os.path.join(tempfile.mkdtemp(), "cache.json")
+        cache = MetadataCache(path=path)
+        cache.set("fields", [{"id": "summary"}], 60)
+        cache.set("statuses", ["Open"], 0.05)
+        time.sleep(0.1)
+        reloaded = MetadataCache(path=path)
+        self.assertEqual(reloaded.get("fields"), (True, [{"id": "summary"}]))
+        self.assertEqual(reloaded.get("statuses"), (False, None))
+        self.assertTrue(reloaded.stats()["persistent"])
+
+
+if __name__ == "__main__":
+    unittest.main()
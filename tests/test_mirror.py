@@ -0,0 +1,109 @@
+"""IssueMirror answers compared with the fake Jira server's own JQL evaluation.
+
+    python -m unittest discover tests
+"""
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(ROOT), str(ROOT / "benchmarks")]
+
+from jira import JIRA  # noqa: E402
+
+from fakejira import FakeJira  # noqa: E402
+from mirror import IssueMirror  # noqa: E402
+
+QUERIES = [
+    "project = BENCH",
+    'status = "In Progress"',
+    "status != Done",
+    "status in (Open, Done)",
+    "status not in (Open)",
+    "key = BENCH-7",
+    "key in (BENCH-1, BENCH-2, BENCH-99)",
+    "assignee = Alice",
+    "assignee = acc-1",
+    "assignee != Bob",
+    "assignee not in (Alice, Bob)",
+    "assignee is EMPTY",
+    "assignee is not EMPTY",
+    "assignee = currentUser()",
+    "labels = bench",
+    "labels in (bench, urgent)",
+    "labels != bench",
+    "labels not in (urgent)",
+    "labels is EMPTY",
+    "labels is not EMPTY",
+    'updated >= "2024/05/20" AND updated < "2024/05/25"',
+    "created > 2024-04-30 AND updated <= -1d",
+    "updated >= -1d",
+    "project = BENCH AND status != Open AND labels = bench AND assignee is not EMPTY",
+]
+
+
+class MirrorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.fake = FakeJira(issues=60, latency=0, page_size=25, payload_bytes=16).start()
+        self.addCleanup(self.fake.stop)
+        self.client = JIRA(options={"server": self.fake.url}, max_retries=0)
+        self.addCleanup(self.client.close)
+        self.mirror = IssueMirror(os.path.join(tempfile.mkdtemp(), "mirror.db"), ["BENCH"])
+        self.assertEqual(self.mirror.sync(self.client)["BENCH"]["upserted"], 60)
+
+    def mirrored(self, query: str) -> list:
+        return [issue.key for issue in self.mirror.search_issues(query, maxResults=1000)]
+
+    def expected(self, query: str) -> list:
+        return [f"BENCH-{number}" for number in self.fake.search(query)]
+
+    def assertSameIssues(self, query: str):
+        self.assertTrue(self.mirror.covers(f"project = BENCH AND {query}", "summary"), query)
+        self.assertEqual(sorted(self.mirrored(query)), sorted(self.expected(query)), query)
+
+    def test_every_operator_matches_jira(self):
+        for query in QUERIES:
+            with self.subTest(query=query):
+                self.assertSameIssues(query)
+
+    def test_negations_do_not_match_empty_fields(self):
+        for query in ("labels != bench", "labels not in (urgent)", "assignee != Bob"):
+            with self.subTest(query=query):
+                keys = self.mirrored(query)
+                self.assertTrue(keys)
+                for key in keys:
+                    fields = self.mirror.get_issue(key, "summary,labels,assignee").raw["fields"]
+                    self.assertTrue(fields["labels"] if query.startswith("labels") else fields["assignee"])
+
+    def test_order_by(self):
+        for query in ("labels = bench ORDER BY updated DESC, key ASC", "status = Open ORDER BY key DESC", "assignee is EMPTY ORDER BY created ASC, key DESC"):
+            with self.subTest(query=query):
+                self.assertEqual(self.mirrored(query), self.expected(query))
+
+    def test_incremental_sync_loads_updated_issues(self):
+        self.fake.edit(5, {"summary": "Changed", "labels": ["urgent"], "assignee": None})
+        result = self.mirror.sync(self.client)["BENCH"]
+        self.assertEqual(result["mode"], "incremental")
+        self.assertLess(result["upserted"], 60)
+        self.assertEqual(self.mirror.get_issue("BENCH-5", "summary,labels,assignee").raw["fields"]["summary"], "Changed")
+        self.assertEqual(self.mirrored("updated >= -1d"), ["BENCH-5"])
+        for query in ("labels = urgent", "labels is EMPTY", "assignee is EMPTY", "updated >= -1d"):
+            with self.subTest(query=query):
+                self.assertSameIssues(query)
+
+    def test_written_issues_are_not_served_until_the_next_sync(self):
+        self.mirror.mark_stale(["bench-5"])
+        self.assertIsNone(self.mirror.get_issue("BENCH-5", "summary,labels,assignee"))
+        self.assertIsNotNone(self.mirror.get_issue("BENCH-6", "summary,labels,assignee"))
+        self.assertFalse(self.mirror.covers("project = BENCH AND labels = bench", "summary"))
+        self.fake.edit(5, {"summary": "Written"})
+        self.mirror.sync(self.client)
+        self.assertEqual(self.mirror.get_issue("BENCH-5", "summary,labels,assignee").raw["fields"]["summary"], "Written")
+        self.assertTrue(self.mirror.covers("project = BENCH AND labels = bench", "summary"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+"""Throttling behaviour of RequestScheduler and ThrottledAdapter against the fake Jira server.
+
+    python -m unittest discover tests
+"""
+import sys
+import time
+import unittest
+from pathlib import Path
+
+import requests
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(ROOT), str(ROOT / "benchmarks")]
+
+from fakejira import FakeJira  # noqa: E402
+from ratelimit import RequestScheduler  # noqa: E402
+from transport import ThrottledAdapter  # noqa: E402
+
+
+class ThrottlingTest(unittest.TestCase):
+
+    def session(self, fake: FakeJira, scheduler: RequestScheduler, **kwargs):
+        self.responses = []
+        adapter = ThrottledAdapter(scheduler, base_delay=0.01, max_delay=0.1, on_response=self.responses.append, **kwargs)
+        session = requests.Session()
+        session.mount("http://", adapter)
+        self.addCleanup(session.close)
+        return session
+
+    def fake(self, **kwargs) -> FakeJira:
+        fake = FakeJira(issues=10, latency=0, **kwargs).start()
+        self.addCleanup(fake.stop)
+        return fake
+
+    def test_unthrottled_server_is_not_paced(self):
+        fake = self.fake()
+        scheduler = RequestScheduler(burst=2, max_rate=5)
+        session = self.session(fake, scheduler)
+        start = time.perf_counter()
+        for _ in range(20):
+            self.assertEqual(session.get(f"{fake.url}/rest/api/2/myself").status_code, 200)
+        # At 5 requests per second with a burst of 2 these would take more than 3 seconds
+        self.assertLess(time.perf_counter() - start, 1.5)
+        self.assertFalse(scheduler.limited)
+        self.assertEqual(scheduler.stats()["total_wait_s"], 0)
+
+    def test_429_starts_pacing_and_is_retried(self):
+        fake = self.fake(throttle_every=3, retry_after=0.05)
+        scheduler = RequestScheduler(max_rate=1000)
+        session = self.session(fake, scheduler)
+        for _ in range(10):
+            self.assertEqual(session.get(f"{fake.url}/rest/api/2/myself").status_code, 200)
+        self.assertTrue(scheduler.limited)
+        self.assertLess(scheduler.rate, 1000)
+        self.assertEqual(scheduler.throttled, fake.counts()["throttled"])
+        self.assertEqual(scheduler.retries, scheduler.throttled)
+
+    def test_every_attempt_reaches_the_response_callback(self):
+        fake = self.fake(throttle_every=2)
+        session = self.session(fake, RequestScheduler())
+        session.get(f"{fake.url}/rest/api/2/myself")
+        session.get(f"{fake.url}/rest/api/2/myself")
+        self.assertEqual([response.status_code for response in self.responses], [200, 429, 200])
+        self.assertEqual(len(self.responses), fake.counts()["total"])
+
+    def test_writes_are_not_retried_after_exhausting_attempts(self):
+        fake = self.fake(throttle_every=1)
+        scheduler = RequestScheduler()
+        session = self.session(fake, scheduler, retries=2)
+        response = session.put(f"{fake.url}/rest/api/2/issue/BENCH-1", data=b'{"fields": {}}')
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(fake.counts()["total"], 3)
+
+    def test_rate_limit_headers_set_the_rate(self):
+        scheduler = RequestScheduler(max_rate=100)
+        response = requests.Response()
+        response.status_code = 200
+        response.headers.update({"X-RateLimit-FillRate": "10", "X-RateLimit-Interval-Seconds": "2"})
+        scheduler.observe(response)
+        self.assertTrue(scheduler.limited)
+        self.assertEqual(scheduler.rate, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
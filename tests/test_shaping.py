@@ -0,0 +1,97 @@
+"""Slim schemas and the size-budgeted list envelope.
+
+    python -m unittest discover tests
+"""
+import sys
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pagination import encode_cursor, wire_size  # noqa: E402
+from shaping import compact, custom_field_names, encode_list, resolve_field_ids, slim  # noqa: E402
+
+USERS = [slim({"accountId": f"acc-{n}", "displayName": f"User {n}", "active": True, "accountType": "atlassian"}, "user") for n in range(20)]
+
+
+class SlimTest(unittest.TestCase):
+
+    def test_user_schema(self):
+        raw = {"accountId": "a1", "displayName": "Alice", "emailAddress": "a@example.com", "active": False, "accountType": "app", "avatarUrls": {"48x48": "..."}}
+        self.assertEqual(slim(SimpleNamespace(raw=raw), "user"), {"accountId": "a1", "displayName": "Alice", "email": "a@example.com", "active": False, "accountType": "app"})
+
+    def test_nested_paths(self):
+        raw = {"id": "customfield_1", "name": "Points", "custom": True, "schema": {"type": "number"}}
+        self.assertEqual(slim(raw, "field"), {"id": "customfield_1", "name": "Points", "custom": True, "type": "number"})
+
+    def test_compact_keeps_false_and_zero(self):
+        self.assertEqual(compact({"a": None, "b": "", "c": [None, {}], "d": False, "e": 0, "f": {"g": []}}), {"d": False, "e": 0})
+
+
+class FieldNamesTest(unittest.TestCase):
+
+    FIELDS = [
+        {"id": "summary", "name": "Summary"},
+        {"id": "customfield_1", "name": "Story Points", "custom": True},
+        {"id": "customfield_2", "name": "Team", "custom": True},
+        {"id": "customfield_3", "name": "Team", "custom": True},
+    ]
+
+    def test_names_resolve_to_ids(self):
+        self.assertEqual(resolve_field_ids("summary, story points,*navigable,-comment,unknown", self.FIELDS), "summary,customfield_1,*navigable,-comment,unknown")
+
+    def test_shared_custom_names_are_not_renamed(self):
+        self.assertEqual(custom_field_names(self.FIELDS), {"customfield_1": "Story Points"})
+
+
+class EncodeListTest(unittest.TestCase):
+
+    def test_without_budget_everything_is_returned(self):
+        result = encode_list(USERS, "user", "search_users:")
+        self.assertEqual((result["total"], result["returned"], result["next_cursor"]), (20, 20, None))
+        self.assertEqual(result["items"], USERS)
+
+    def test_columns_only_include_present_fields(self):
+        result = encode_list(USERS, "user", "search_users:", fmt="columns")
+        self.assertEqual(result["columns"], ["accountId", "displayName", "active", "accountType"])
+        self.assertEqual(result["rows"][1], ["acc-1", "User 1", True, "atlassian"])
+        self.assertNotIn("items", result)
+
+    def test_budget_cuts_the_page_and_the_cursor_resumes_it(self):
+        budget = sum(wire_size(row) for row in USERS[:5])
+        first = encode_list(USERS, "user", "search_users:", max_bytes=budget)
+        self.assertEqual(first["returned"], 5)
+        second = encode_list(USERS, "user", "search_users:", max_bytes=budget, cursor=first["next_cursor"])
+        self.assertEqual(second["items"], USERS[5:10])
+        items = first["items"] + second["items"]
+        cursor = second["next_cursor"]
+        while cursor:
+            page = encode_list(USERS, "user", "search_users:", max_bytes=budget, cursor=cursor)
+            items += page["items"]
+            cursor = page["next_cursor"]
+        self.assertEqual(items, USERS)
+
+    def test_at_least_one_row_is_returned(self):
+        result = encode_list(USERS, "user", "search_users:", fmt="columns", max_bytes=1)
+        self.assertEqual(result["returned"], 1)
+        self.assertIsNotNone(result["next_cursor"])
+
+    def test_cursor_of_another_listing_is_rejected(self):
+        cursor = encode_list(USERS, "user", "search_users:alice", max_bytes=100)["next_cursor"]
+        with self.assertRaises(ValueError):
+            encode_list(USERS, "user", "search_users:bob", cursor=cursor)
+        with self.assertRaises(ValueError):
+            encode_list(USERS, "user", "search_users:bob", cursor="not a cursor")
+
+    def test_cursor_past_the_end(self):
+        result = encode_list(USERS, "user", "search_users:", cursor=encode_cursor("search_users:", 50))
+        self.assertEqual((result["returned"], result["next_cursor"]), (0, None))
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            encode_list(USERS, "user", "search_users:", fmt="csv")
+
+
+if __name__ == "__main__":
+    unittest.main()
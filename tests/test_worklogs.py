@@ -0,0 +1,104 @@
+"""WorklogReport windowing, deduplication and bulk collection.
+
+    python -m unittest discover tests
+"""
+import sys
+import unittest
+from datetime import date
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(ROOT), str(ROOT / "benchmarks")]
+
+from jira import JIRA  # noqa: E402
+
+from fakejira import FakeJira  # noqa: E402
+from worklogs import WorklogReport, collect_bulk, epoch_ms, parse_day  # noqa: E402
+
+
+def worklog(worklog_id, started, seconds, author="Alice", issue_id="10001"):
+    return {"id": worklog_id, "issueId": issue_id, "started": started, "timeSpentSeconds": seconds, "author": {"displayName": author}}
+
+
+class ParseDayTest(unittest.TestCase):
+
+    def test_dates_and_timestamps(self):
+        self.assertEqual(parse_day("2024-05-03"), date(2024, 5, 3))
+        self.assertEqual(parse_day("2024-05-03T23:30:00.000+0200"), date(2024, 5, 3))
+
+    def test_invalid_dates(self):
+        for value in ("05/03/2024", "", None):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    parse_day(value)
+
+    def test_epoch_ms_is_utc_midnight(self):
+        self.assertEqual(epoch_ms(date(1970, 1, 2)), 86400000)
+
+
+class WorklogReportTest(unittest.TestCase):
+
+    def report(self, **kwargs) -> WorklogReport:
+        return WorklogReport(date(2024, 5, 2), date(2024, 5, 3), {"10001": "A-1", "10002": "A-2"}, **kwargs)
+
+    def test_window_is_inclusive_and_uses_the_started_date(self):
+        report = self.report()
+        report.add("A-1", worklog("1", "2024-05-01T23:59:00.000+0000", 3600))
+        report.add("A-1", worklog("2", "2024-05-02T00:00:00.000+0000", 3600))
+        # Local date as written, even where UTC is already the next day
+        report.add("A-1", worklog("3", "2024-05-03T23:30:00.000-0500", 3600))
+        report.add("A-1", worklog("4", "2024-05-04T00:10:00.000+0200", 3600))
+        self.assertEqual(report.result()["by_day"], {"2024-05-02": 1.0, "2024-05-03": 1.0})
+
+    def test_worklogs_are_counted_once(self):
+        report = self.report()
+        for _ in range(3):
+            report.add("A-1", worklog("1", "2024-05-02T10:00:00.000+0000", 1800))
+        report.add_bulk([worklog("1", "2024-05-02T10:00:00.000+0000", 1800)])
+        result = report.result()
+        self.assertEqual((result["worklogs"], result["total_h"]), (1, 0.5))
+
+    def test_bulk_worklogs_of_other_issues_are_ignored(self):
+        report = self.report()
+        report.add_bulk([
+            worklog("1", "2024-05-02T10:00:00.000+0000", 3600, issue_id=10002),
+            worklog("2", "2024-05-02T10:00:00.000+0000", 3600, issue_id="99999"),
+        ])
+        self.assertEqual(report.result()["by_issue"], {"A-2": 1.0})
+
+    def test_result_is_rounded_and_grouped(self):
+        report = self.report(include_entries=True)
+        report.add("A-2", worklog("1", "2024-05-03T10:00:00.000+0000", 1000, author="Bob"))
+        report.add("A-1", worklog("2", "2024-05-02T10:00:00.000+0000", 1000, author="Bob"))
+        report.add("A-1", {"id": "3", "started": "2024-05-02T11:00:00.000+0000", "timeSpentSeconds": 3600, "updateAuthor": {"name": "carol"}})
+        result = report.result()
+        self.assertEqual(result["total_h"], 1.56)
+        self.assertEqual(result["by_user"], {"Bob": 0.56, "carol": 1.0})
+        self.assertEqual(result["by_user_day"]["Bob"], {"2024-05-02": 0.28, "2024-05-03": 0.28})
+        self.assertEqual([entry["id"] for entry in result["entries"]], ["2", "3", "1"])
+
+
+class CollectBulkTest(unittest.TestCase):
+
+    def test_matches_per_issue_worklogs(self):
+        fake = FakeJira(issues=30, latency=0, worklogs_per_issue=3).start()
+        self.addCleanup(fake.stop)
+        client = JIRA(options={"server": fake.url}, max_retries=0)
+        self.addCleanup(client.close)
+        since, until = date(2024, 5, 5), date(2024, 5, 9)
+        issue_keys = {str(10000 + number): f"BENCH-{number}" for number in range(1, 11)}
+
+        bulk = WorklogReport(since, until, issue_keys)
+        scanned = collect_bulk(client, bulk, since)
+        expected = WorklogReport(since, until, issue_keys)
+        for number in range(1, 11):
+            for entry in fake.worklogs(number):
+                expected.add(f"BENCH-{number}", entry)
+
+        self.assertEqual(scanned, 90)
+        self.assertTrue(bulk.result()["worklogs"])
+        self.assertEqual(bulk.result(), expected.result())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import random
+import time
+from datetime import timedelta
+from typing import Callable, Optional
+
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError
+
+from ratelimit import RequestScheduler, parse_retry_after
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+RETRYABLE_READ_STATUSES = frozenset({429, 502, 503, 504})
+
+
+class ThrottledAdapter(HTTPAdapter):
+    """HTTPAdapter sending every request through a RequestScheduler.
+
+    Idempotent reads are retried on 429/502/503/504 and connection errors with jittered exponential
+    backoff. Writes are retried only on 429, which Jira returns before doing any work. on_response is
+    called with every attempt's response, including the retried ones a session hook never sees"""
+
+    def __init__(self, scheduler: RequestScheduler, retries: int = 4, base_delay: float = 0.5, max_delay: float = 30.0, on_response: Optional[Callable] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.scheduler = scheduler
+        self.on_response = on_response
+        self.retries = retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def _backoff(self, attempt: int, response=None) -> float:
+        retry_after = parse_retry_after(response.headers.get("Retry-After")) if response is not None else None
+        if retry_after is not None:
+            return min(self.max_delay, retry_after) + random.uniform(0, self.base_delay)
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def send(self, request, **kwargs):
+        idempotent = request.method.upper() in IDEMPOTENT_METHODS
+        replayable = request.body is None or isinstance(request.body, (bytes, str))
+        if not idempotent:
+            self.scheduler.acquire_write()
+        try:
+            attempt = 0
+            while True:
+                self.scheduler.acquire()
+                start = time.perf_counter()
+                try:
+                    response = super().send(request, **kwargs)
+                except ConnectionError:
+                    if not (idempotent and attempt < self.retries):
+                        raise
+                    response = None
+                if response is not None:
+                    # Session.send sets elapsed only on the response it returns
+                    response.elapsed = timedelta(seconds=time.perf_counter() - start)
+                    if self.on_response is not None:
+                        self.on_response(response)
+                    self.scheduler.observe(response)
+                    retryable = response.status_code == 429 or (idempotent and response.status_code in RETRYABLE_READ_STATUSES)
+                    if not (retryable and replayable and attempt < self.retries):
+                        return response
+                    response.close()
+                self.scheduler.record_retry()
+                time.sleep(self._backoff(attempt, response))
+                attempt += 1
+        finally:
+            if not idempotent:
+                self.scheduler.release_write()
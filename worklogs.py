@@ -0,0 +1,142 @@
+import json
+import threading
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, wait
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Callable, Optional
+
+from batch import chunked
+from runtime import submit
+
+# Most worklog ids /worklog/list accepts per request
+LIST_BATCH_SIZE = 1000
+
+
+def parse_day(value: str) -> date:
+    """A 'YYYY-MM-DD' date, also accepting a full ISO timestamp"""
+    try:
+        return date.fromisoformat(value[:10])
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid date {value!r}, expected YYYY-MM-DD")
+
+
+def epoch_ms(day: date) -> int:
+    """Milliseconds since the epoch at UTC midnight of day"""
+    return int(datetime.combine(day, time(), tzinfo=timezone.utc).timestamp() * 1000)
+
+
+class WorklogReport:
+    """Thread-safe running aggregation of worklogs started between since and until (inclusive dates).
+
+    Days are the worklog's own calendar date as written in its started timestamp. Worklogs are
+    counted once even when several fetch paths return them"""
+
+    def __init__(self, since: date, until: date, issue_keys: dict, include_entries: bool = False):
+        self.since = since.isoformat()
+        self.until = until.isoformat()
+        self.issue_keys = issue_keys
+        self.include_entries = include_entries
+        self.entries = []
+        self.by_user = defaultdict(float)
+        self.by_issue = defaultdict(float)
+        self.by_day = defaultdict(float)
+        self.by_user_day = defaultdict(lambda: defaultdict(float))
+        self._seen = set()
+        self._lock = threading.Lock()
+
+    def add(self, issue_key: str, worklog: dict) -> None:
+        day = (worklog.get("started") or "")[:10]
+        if not self.since <= day <= self.until:
+            return
+        author = worklog.get("author") or worklog.get("updateAuthor") or {}
+        user = author.get("displayName") or author.get("name") or author.get("accountId") or "Unknown"
+        hours = (worklog.get("timeSpentSeconds") or 0) / 3600
+        with self._lock:
+            if worklog.get("id") in self._seen:
+                return
+            self._seen.add(worklog.get("id"))
+            self.by_user[user] += hours
+            self.by_issue[issue_key] += hours
+            self.by_day[day] += hours
+            self.by_user_day[user][day] += hours
+            if self.include_entries:
+                self.entries.append({"id": worklog.get("id"), "issue": issue_key, "user": user, "day": day, "hours": round(hours, 2)})
+
+    def add_bulk(self, worklogs: list) -> None:
+        """Add worklogs from /worklog/list, keeping only those of the reported issues"""
+        for worklog in worklogs:
+            issue_key = self.issue_keys.get(str(worklog.get("issueId")))
+            if issue_key is not None:
+                self.add(issue_key, worklog)
+
+    def result(self) -> dict:
+        hours = lambda totals: {name: round(value, 2) for name, value in sorted(totals.items())}
+        report = {
+            "since": self.since,
+            "until": self.until,
+            "worklogs": len(self._seen),
+            "total_h": round(sum(self.by_user.values()), 2),
+            "by_user": hours(self.by_user),
+            "by_issue": hours(self.by_issue),
+            "by_day": hours(self.by_day),
+            "by_user_day": {user: hours(days) for user, days in sorted(self.by_user_day.items())},
+        }
+        if self.include_entries:
+            report["entries"] = sorted(self.entries, key=lambda entry: (entry["day"], entry["issue"], entry["user"]))
+        return report
+
+
+def fetch_issue_worklogs(client, issue_key: str, since: date, until: date, page_size: int = 1000) -> list:
+    """All worklogs of one issue; Jira Cloud narrows them to the window with startedAfter/startedBefore"""
+    worklogs = []
+    start_at = 0
+    while True:
+        data = client._get_json(f"issue/{issue_key}/worklog", params={
+            "startAt": start_at,
+            "maxResults": page_size,
+            "startedAfter": epoch_ms(since - timedelta(days=1)),
+            "startedBefore": epoch_ms(until + timedelta(days=2)),
+        })
+        page = data.get("worklogs", [])
+        worklogs.extend(page)
+        start_at += len(page)
+        if not page or start_at >= data.get("total", 0):
+            return worklogs
+
+
+def collect_bulk(client, report: WorklogReport, since: date, progress: Optional[Callable[[int], None]] = None) -> int:
+    """Walk /worklog/updated from since and fetch the changed worklogs with /worklog/list, up to
+    `LIST_BATCH_SIZE` ids per request. List requests run in parallel with the walk. Returns the number of ids scanned"""
+    pending = set()
+    scanned = 0
+    cursor = epoch_ms(since - timedelta(days=1))
+
+    def fetch(ids: list) -> list:
+        response = client._session.post(client._get_url("worklog/list"), data=json.dumps({"ids": ids}))
+        return response.json()
+
+    def drain(block: bool) -> None:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED) if block else ([f for f in pending if f.done()], None)
+        for future in done:
+            pending.discard(future)
+            report.add_bulk(future.result())
+
+    try:
+        while True:
+            data = client._get_json("worklog/updated", params={"since": cursor})
+            ids = [value["worklogId"] for value in data.get("values", [])]
+            scanned += len(ids)
+            for batch in chunked(ids, LIST_BATCH_SIZE):
+                pending.add(submit(fetch, batch))
+            drain(block=False)
+            if progress is not None:
+                progress(scanned)
+            if data.get("lastPage", True) or not ids:
+                break
+            cursor = data["until"]
+        while pending:
+            drain(block=True)
+    finally:
+        for future in pending:
+            future.cancel()
+    return scanned